@@ -1,16 +1,16 @@
+import os
 import sys
-from pathlib import Path
 
 
 def _ensure_src_on_path() -> None:
     if getattr(sys, "frozen", False):
         return
-    root = Path(__file__).resolve().parent
-    src = root / "src"
-    if not src.exists():
+    root = os.path.dirname(os.path.abspath(__file__))
+    src = os.path.join(root, "src")
+    if not os.path.isdir(src):
         return
-    if str(src) not in sys.path:
-        sys.path.insert(0, str(src))
+    if src not in sys.path:
+        sys.path.insert(0, src)
 
 
 _ensure_src_on_path()
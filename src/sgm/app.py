@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from pathlib import Path
 
-from PySide6.QtCore import QStandardPaths
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
-
 from sgm.config import AppConfig
 from sgm.resources import resource_path
-from sgm.ui.main_window import MainWindow
 from sgm.version import APP_NAME
 
+# Qt (and MainWindow, which pulls in all of QtWidgets) is imported lazily in
+# the functions that need it, so importing this module stays cheap.
+
+# Windows font directory handed to Qt via QT_QPA_FONTDIR; empty elsewhere.
+_WIN_FONTS_DIR = (
+    os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts") if os.name == "nt" else ""
+)
+
 
+@functools.lru_cache(maxsize=1)
 def _pick_icon_path() -> Path:
     # Prefer the native icon format per-platform, with fallbacks.
     if sys.platform == "darwin":
@@ -29,22 +34,30 @@ def _pick_icon_path() -> Path:
 
 
 def _app_config_path() -> Path:
+    from PySide6.QtCore import QStandardPaths
+
     cfg_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppConfigLocation))
     return cfg_dir / "sgm.ini"
 
 
 def _load_config() -> tuple[AppConfig, Path]:
-    local_cfg = Path.cwd() / "sgm.ini"
-    app_cfg = _app_config_path()
+    # Probe with plain strings; only build Path objects for the chosen file.
+    local_cfg_str = os.path.join(os.getcwd(), "sgm.ini")
 
     # Prefer existing local config to preserve current Windows behavior.
-    if local_cfg.exists():
+    if os.path.exists(local_cfg_str):
+        local_cfg = Path(local_cfg_str)
         return (AppConfig.load_or_create(local_cfg), local_cfg)
 
+    # Only ask Qt for the per-user location once the local probe has failed.
+    app_cfg = _app_config_path()
+
     # Next prefer existing per-user app config (useful for macOS .app launches).
-    if app_cfg.exists():
+    if os.path.exists(app_cfg):
         return (AppConfig.load_or_create(app_cfg), app_cfg)
 
+    local_cfg = Path(local_cfg_str)
+
     # Neither exists: attempt to create/populate local first.
     try:
         return (AppConfig.load_or_create(local_cfg), local_cfg)
@@ -57,30 +70,35 @@ def _load_config() -> tuple[AppConfig, Path]:
 
 
 def main() -> int:
-    if os.name == "nt" and not os.environ.get("QT_QPA_FONTDIR"):
-        windir = Path(os.environ.get("WINDIR", r"C:\Windows"))
-        fonts_dir = windir / "Fonts"
-        if fonts_dir.exists():
-            os.environ["QT_QPA_FONTDIR"] = str(fonts_dir)
+    if _WIN_FONTS_DIR and not os.environ.get("QT_QPA_FONTDIR") and os.path.isdir(_WIN_FONTS_DIR):
+        os.environ["QT_QPA_FONTDIR"] = _WIN_FONTS_DIR
+
+    from PySide6.QtCore import QTimer
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+
+    from sgm.ui.main_window import MainWindow
 
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
 
     icon_path = _pick_icon_path()
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    icon = QIcon(str(icon_path)) if icon_path.exists() else None
+    if icon is not None:
+        app.setWindowIcon(icon)
 
     config, config_path = _load_config()
 
     window = MainWindow(config=config, config_path=config_path)
-    if icon_path.exists():
-        window.setWindowIcon(QIcon(str(icon_path)))
+    if icon is not None:
+        window.setWindowIcon(icon)
     window.show()
 
-    # Auto-load last folder if present.
+    # Auto-load last folder if present. Scheduled on the event loop so the
+    # window paints before the folder scan touches the disk.
     if config.last_game_folder and config.last_game_folder.lower() != "none":
         last = Path(config.last_game_folder)
         if last.exists() and last.is_dir():
-            window.load_folder(last)
+            QTimer.singleShot(0, lambda: window.load_folder(last))
 
     return app.exec()
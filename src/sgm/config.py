@@ -1,33 +1,68 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-
-
-@dataclass(frozen=True)
+from typing import Any, Callable
+
+
+# One `Key=Value` assignment per line. Comment lines (`#`/`;`) and lines
+# without `=` never match because keys must start with a letter/underscore.
+# A trailing `\r` (CRLF files read as bytes) is treated as whitespace.
+_INI_LINE = re.compile(r"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
+
+_DEFAULT_METADATA_EDITORS = (
+    "Parker Brothers",
+    "Mattel",
+    "Imagic",
+    "Coleco",
+    "Sega Enterprises",
+    "INTV",
+    "Activision",
+    "Atarisoft",
+)
+
+_DEFAULT_JSON_KEYS = (
+    "name",
+    "nb_players",
+    "editor",
+    "year",
+    "description/en",
+    "jzintv_extra",
+    "save_highscores",
+)
+
+# `<width>x<height>`, e.g. `186x256`.
+_RES_RE = re.compile(r"^\s*(\d+)\s*[xX]\s*(\d+)\s*$")
+
+# dataclass(slots=True) needs Python 3.10; older Pythons (mac may run 3.9)
+# keep regular __dict__-backed instances.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Resolution:
     width: int
     height: int
 
     @staticmethod
-    def parse(value: str, *, default: "Resolution") -> "Resolution":
-        try:
-            parts = value.lower().strip().split("x")
-            if len(parts) != 2:
-                return default
-            w = int(parts[0].strip())
-            h = int(parts[1].strip())
-            if w <= 0 or h <= 0:
-                return default
-            return Resolution(w, h)
-        except Exception:
+    def parse(value: str | None, *, default: "Resolution") -> "Resolution":
+        m = _RES_RE.match(value) if isinstance(value, str) else None
+        if m is None:
+            return default
+        w = int(m.group(1))
+        h = int(m.group(2))
+        if w <= 0 or h <= 0:
             return default
+        return Resolution(w, h)
 
     def to_string(self) -> str:
         return f"{self.width}x{self.height}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppConfig:
     last_game_folder: str = "none"
     language: str = "en"
@@ -51,55 +86,47 @@ class AppConfig:
     # from it (only if Overlay 1 is currently missing).
     auto_build_overlay: bool = False
 
+    # If True: derived Box Small images are written as 256-colour palette PNGs
+    # (smaller and faster to encode/decode than RGBA).
+    paletted_box_small: bool = False
+
+    # If True: generated PNGs use fast, light zlib compression (~3x faster to
+    # encode, ~15-20% larger files). Off by default to keep output small.
+    fast_png_encode: bool = False
+
     # Used when building jzintv flags that reference files on the target device.
     # Example output: --kbdhackfile="<prefix>/<relative_path>"
     jzintv_media_prefix: str = "/media/usb0"
 
-    metadata_editors: list[str] = None  # populated in defaults()
+    metadata_editors: list[str] = field(default_factory=list)  # populated in defaults()
 
     # Used by Bulk JSON Update dialog to offer common JSON keys.
     # Supports nested paths like description/en.
-    json_keys: list[str] = None  # populated in defaults()
+    json_keys: list[str] = field(default_factory=list)  # populated in defaults()
 
     @staticmethod
     def defaults() -> "AppConfig":
         cfg = AppConfig()
-        cfg.metadata_editors = [
-            "Parker Brothers",
-            "Mattel",
-            "Imagic",
-            "Coleco",
-            "Sega Enterprises",
-            "INTV",
-            "Activision",
-            "Atarisoft",
-        ]
-
-        cfg.json_keys = [
-            "name",
-            "nb_players",
-            "editor",
-            "year",
-            "description/en",
-            "jzintv_extra",
-            "save_highscores",
-        ]
+        # Fresh lists per instance: the UI edits these in place.
+        cfg.metadata_editors = list(_DEFAULT_METADATA_EDITORS)
+        cfg.json_keys = list(_DEFAULT_JSON_KEYS)
         return cfg
 
     @staticmethod
     def _to_ini_kv(cfg: "AppConfig") -> dict[str, str]:
         editors = cfg.metadata_editors or []
         editors_clean = [str(e).strip() for e in editors if str(e).strip()]
-        editors_clean_sorted = sorted(editors_clean, key=lambda s: s.casefold())
+        editors_clean_sorted = sorted(editors_clean, key=str.lower)
 
         json_keys = cfg.json_keys or []
+        json_keys_seen: set[str] = set()
         json_keys_clean: list[str] = []
         for k in json_keys:
             s = str(k).strip()
-            if not s:
+            if not s or s in json_keys_seen:
                 continue
-            if s not in json_keys_clean:
-                json_keys_clean.append(s)
+            json_keys_seen.add(s)
+            json_keys_clean.append(s)
         return {
             "LastGameFolder": (cfg.last_game_folder or "none"),
             "Language": (cfg.language or "en").strip().lower() or "en",
@@ -117,85 +144,78 @@ class AppConfig:
             "SnapResolution": cfg.snap_resolution.to_string(),
             "UseBoxImageForBoxSmall": "True" if cfg.use_box_image_for_box_small else "False",
             "AutoBuildOverlay": "True" if cfg.auto_build_overlay else "False",
+            "PalettedBoxSmall": "True" if cfg.paletted_box_small else "False",
+            "FastPngEncode": "True" if cfg.fast_png_encode else "False",
             "JzIntvMediaPrefix": (cfg.jzintv_media_prefix or "/media/usb0").strip() or "/media/usb0",
             "MetadataEditors": "|".join(editors_clean_sorted),
             "JsonKeys": "|".join(json_keys_clean),
         }
 
     @staticmethod
-    def _upgrade_ini_if_missing_keys(path: Path, *, defaults: "AppConfig") -> None:
+    def _parse_ini_text(text: str) -> dict[str, str]:
+        return dict(_INI_LINE.findall(text))
+
+    @staticmethod
+    def _upgrade_ini_if_missing_keys(
+        path: Path, text: str, data: dict[str, str], *, defaults: "AppConfig"
+    ) -> None:
         """Ensure an existing ini contains all known keys.
 
         Preserves existing file contents and values; only appends missing keys
-        with default values.
+        with default values. `text`/`data` are the already-read file contents
+        and their parsed form, so the file is not read a second time.
         """
 
-        try:
-            text = path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            return
-
-        present: set[str] = set()
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            if line.startswith("#") or line.startswith(";"):
-                continue
-            if "=" not in line:
-                continue
-            k, _ = line.split("=", 1)
-            key = k.strip()
-            if key:
-                present.add(key)
-
         expected = AppConfig._to_ini_kv(defaults)
-        missing = [k for k in expected.keys() if k not in present]
+        missing = [k for k in expected.keys() if k not in data]
         if not missing:
             return
 
         # Append missing keys at the end to avoid rewriting/normalizing the file.
-        out = text
-        if out and not out.endswith("\n"):
+        out = ""
+        if text and not text.endswith("\n"):
             out += "\n"
         for k in missing:
             out += f"{k}={expected[k]}\n"
 
         try:
-            path.write_text(out, encoding="utf-8")
+            with path.open("a", encoding="utf-8") as f:
+                f.write(out)
         except Exception:
             return
 
     @staticmethod
-    def load_or_create(path: Path) -> "AppConfig":
+    def load_or_create(path: str | os.PathLike[str]) -> "AppConfig":
+        path = Path(path)
         if not path.exists():
             cfg = AppConfig.defaults()
             cfg.save(path)
             return cfg
+
+        try:
+            text = _read_ini_text(path)
+        except Exception:
+            return AppConfig.defaults()
+
+        data = AppConfig._parse_ini_text(text)
         # Upgrade existing ini files by appending any newly-added settings.
-        defaults = AppConfig.defaults()
-        AppConfig._upgrade_ini_if_missing_keys(path, defaults=defaults)
-        return AppConfig.load(path)
+        # Missing keys fall back to the same defaults in _from_kv, so the
+        # parsed data does not need to be refreshed afterwards.
+        AppConfig._upgrade_ini_if_missing_keys(path, text, data, defaults=AppConfig.defaults())
+        return AppConfig._from_kv(data)
 
     @staticmethod
-    def load(path: Path) -> "AppConfig":
-        cfg = AppConfig.defaults()
+    def load(path: str | os.PathLike[str]) -> "AppConfig":
+        path = Path(path)
         try:
-            text = path.read_text(encoding="utf-8", errors="replace")
+            text = _read_ini_text(path)
         except Exception:
-            return cfg
+            return AppConfig.defaults()
+        return AppConfig._from_kv(AppConfig._parse_ini_text(text))
 
-        data: dict[str, str] = {}
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            if line.startswith("#") or line.startswith(";"):
-                continue
-            if "=" not in line:
-                continue
-            k, v = line.split("=", 1)
-            data[k.strip()] = v.strip()
+    @staticmethod
+    def _from_kv(data: dict[str, str]) -> "AppConfig":
+        cfg = AppConfig.defaults()
 
         cfg.last_game_folder = data.get("LastGameFolder", cfg.last_game_folder)
 
@@ -203,74 +223,38 @@ class AppConfig:
         # Supported description languages.
         cfg.language = lang if lang in {"en", "fr", "es", "de", "it"} else "en"
 
-        cfg.desired_max_base_file_length = _parse_int(
-            data.get("DesiredMaxBaseFileLength"), default=cfg.desired_max_base_file_length
-        )
-        cfg.desired_number_of_snaps = _parse_int(
-            data.get("DesiredNumberOfSnaps"), default=cfg.desired_number_of_snaps
-        )
+        for key, attr, parse in _TYPED_INI_FIELDS:
+            setattr(cfg, attr, parse(data.get(key), default=getattr(cfg, attr)))
         cfg.desired_number_of_snaps = max(0, min(3, cfg.desired_number_of_snaps))
 
-        cfg.box_resolution = Resolution.parse(
-            data.get("BoxResolution", cfg.box_resolution.to_string()),
-            default=cfg.box_resolution,
-        )
-        cfg.box_small_resolution = Resolution.parse(
-            data.get("BoxSmallResolution", cfg.box_small_resolution.to_string()),
-            default=cfg.box_small_resolution,
-        )
-        cfg.overlay_resolution = Resolution.parse(
-            data.get("OverlayResolution", cfg.overlay_resolution.to_string()),
-            default=cfg.overlay_resolution,
-        )
-        cfg.overlay_big_resolution = Resolution.parse(
-            data.get("OverlayBigResolution", cfg.overlay_big_resolution.to_string()),
-            default=cfg.overlay_big_resolution,
-        )
-        cfg.overlay_build_resolution = Resolution.parse(
-            data.get("OverlayBuildResolution", cfg.overlay_build_resolution.to_string()),
-            default=cfg.overlay_build_resolution,
-        )
-        cfg.overlay_build_position = _parse_position(
-            data.get("OverlayBuildPosition"),
-            default=cfg.overlay_build_position,
-        )
         cfg.overlay_template_override = data.get("OverlayTemplateOverride", "").strip()
         cfg.overlay_cutter_template = data.get("OverlayCutterTemplate", "").strip()
-        cfg.qrcode_resolution = Resolution.parse(
-            data.get("QrCodeResolution", cfg.qrcode_resolution.to_string()),
-            default=cfg.qrcode_resolution,
-        )
-        cfg.snap_resolution = Resolution.parse(
-            data.get("SnapResolution", cfg.snap_resolution.to_string()),
-            default=cfg.snap_resolution,
-        )
-
-        cfg.use_box_image_for_box_small = _parse_bool(
-            data.get("UseBoxImageForBoxSmall"), default=cfg.use_box_image_for_box_small
-        )
-
-        cfg.auto_build_overlay = _parse_bool(
-            data.get("AutoBuildOverlay"), default=cfg.auto_build_overlay
-        )
-
         cfg.jzintv_media_prefix = (data.get("JzIntvMediaPrefix", cfg.jzintv_media_prefix) or "").strip() or "/media/usb0"
-
-        cfg.metadata_editors = _parse_string_list(
-            data.get("MetadataEditors"),
-            default=cfg.metadata_editors,
-        )
-
-        cfg.json_keys = _parse_string_list(
-            data.get("JsonKeys"),
-            default=cfg.json_keys,
-        )
         return cfg
 
     def save(self, path: Path) -> None:
-        kv = AppConfig._to_ini_kv(self)
-        lines = [f"{k}={v}" for k, v in kv.items()]
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # One `Key=Value` line per setting, in _to_ini_kv's order, with the
+        # platform's line endings (as text-mode writes produce).
+        nl = os.linesep
+        data = "".join(f"{k}={v}{nl}" for k, v in AppConfig._to_ini_kv(self).items()).encode("utf-8")
+        # Write to a sibling temp file and swap it in, so an interrupted save
+        # never leaves a truncated ini behind.
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except Exception:
+                pass
+            raise
+
+
+def _read_ini_text(path: Path) -> str:
+    # Single raw read + decode; the regex parser copes with CRLF itself, so
+    # text-mode newline translation is not needed.
+    return path.read_bytes().decode("utf-8", errors="replace")
 
 
 def _parse_int(value: str | None, *, default: int) -> int:
@@ -299,9 +283,9 @@ def _parse_position(value: str | None, *, default: tuple[int, int]) -> tuple[int
 
     try:
         raw = value.strip().lower().replace(" ", "")
-        if "," not in raw:
+        a, sep, b = raw.partition(",")
+        if not sep:
             return default
-        a, b = raw.split(",", 1)
         x = int(a)
         y = int(b)
         if x < 0 or y < 0:
@@ -321,11 +305,34 @@ def _parse_string_list(value: str | None, *, default: list[str]) -> list[str]:
 
     # Prefer '|' as a delimiter; fall back to comma.
     parts = raw.split("|") if "|" in raw else raw.split(",")
+    seen: set[str] = set()
     out: list[str] = []
     for p in parts:
         s = p.strip()
-        if not s:
+        if not s or s in seen:
             continue
-        if s not in out:
-            out.append(s)
+        seen.add(s)
+        out.append(s)
     return out
+
+
+# Typed ini keys: (ini key, AppConfig attribute, parser). Each parser takes the
+# raw value (None when the key is absent) and falls back to `default`.
+_TYPED_INI_FIELDS: tuple[tuple[str, str, Callable[..., Any]], ...] = (
+    ("DesiredMaxBaseFileLength", "desired_max_base_file_length", _parse_int),
+    ("DesiredNumberOfSnaps", "desired_number_of_snaps", _parse_int),
+    ("BoxResolution", "box_resolution", Resolution.parse),
+    ("BoxSmallResolution", "box_small_resolution", Resolution.parse),
+    ("OverlayResolution", "overlay_resolution", Resolution.parse),
+    ("OverlayBigResolution", "overlay_big_resolution", Resolution.parse),
+    ("OverlayBuildResolution", "overlay_build_resolution", Resolution.parse),
+    ("OverlayBuildPosition", "overlay_build_position", _parse_position),
+    ("QrCodeResolution", "qrcode_resolution", Resolution.parse),
+    ("SnapResolution", "snap_resolution", Resolution.parse),
+    ("UseBoxImageForBoxSmall", "use_box_image_for_box_small", _parse_bool),
+    ("AutoBuildOverlay", "auto_build_overlay", _parse_bool),
+    ("PalettedBoxSmall", "paletted_box_small", _parse_bool),
+    ("FastPngEncode", "fast_png_encode", _parse_bool),
+    ("MetadataEditors", "metadata_editors", _parse_string_list),
+    ("JsonKeys", "json_keys", _parse_string_list),
+)
@@ -1,63 +1,174 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
-import qrcode
 from PIL import Image
 
 from sgm.config import Resolution
 
+try:
+    # Optional: libjpeg-turbo bindings, faster than Pillow's JPEG decoder.
+    import simplejpeg  # type: ignore
+except Exception:
+    simplejpeg = None
+
+_JPEG_SUFFIXES = {".jpg", ".jpeg", ".jpe", ".jfif"}
+
+
+# zlib level for generated PNGs; None keeps Pillow's default (6). The
+# FastPngEncode setting switches to level 1, which encodes ~3x faster for
+# ~15-20% larger files.
+_png_compress_level: int | None = None
+
+
+# point() table turning an alpha channel into a paste mask: 0 stays 0, any
+# visible alpha becomes 255 (copy the pixel as is).
+_OPAQUE_MASK_LUT = [0] + [255] * 255
+
 
 class ImageProcessError(RuntimeError):
     pass
 
 
-def pil_from_qimage(qimage) -> Image.Image:
-    # qimage is a PySide6.QtGui.QImage
+def set_fast_png_encode(enabled: bool) -> None:
+    global _png_compress_level
+    _png_compress_level = 1 if enabled else None
+
+
+def _as_rgba(img: Image.Image) -> Image.Image:
+    # convert() always copies, even when the mode already matches.
+    # Only use this for fully-loaded images (not inside `with Image.open(...)`).
+    return img if img.mode == "RGBA" else img.convert("RGBA")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_rgba_sized(path_str: str, mtime_ns: int, file_size: int, size: tuple[int, int]) -> Image.Image:
+    # mtime/size are only part of the cache key, so editing the template on
+    # disk invalidates the cached copy.
+    with Image.open(path_str) as opened:
+        img = opened.convert("RGBA")
+    if img.size != size:
+        img = img.resize(size, resample=Image.LANCZOS)
+    return img
+
+
+def _cached_rgba(path: Path, size: tuple[int, int]) -> Image.Image:
+    """Load a template PNG as RGBA at `size`, reusing earlier decodes.
+
+    The returned image is shared between calls: never draw into it.
+    """
+
+    st = path.stat()
+    return _load_rgba_sized(str(path), st.st_mtime_ns, st.st_size, size)
+
+
+def _draft_for_target(img: Image.Image, size: tuple[int, int]) -> None:
+    # JPEG only: let the decoder downscale by 1/2, 1/4 or 1/8 while decoding,
+    # keeping at least 2x the target size so the LANCZOS pass still has detail.
+    # Must be called on a freshly opened image, before it is loaded.
+    if img.format != "JPEG":
+        return
     try:
-        from PySide6.QtGui import QImage
+        img.draft("RGB", (size[0] * 2, size[1] * 2))
+    except Exception:
+        pass
 
-        if not isinstance(qimage, QImage):
-            raise ImageProcessError("Clipboard does not contain an image")
 
-        img = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
-        w = img.width()
-        h = img.height()
+def _fit_size(size: tuple[int, int], expected: Resolution) -> tuple[int, int]:
+    # Largest size with the same aspect ratio that fits inside `expected`.
+    iw, ih = size
+    scale = min(expected.width / iw, expected.height / ih)
+    return (max(1, int(round(iw * scale))), max(1, int(round(ih * scale))))
 
-        nbytes = int(img.sizeInBytes())
-        buf = img.bits()
 
-        raw: bytes
-        if hasattr(buf, "setsize"):
-            buf.setsize(nbytes)
-            raw = bytes(buf)
-        else:
-            if hasattr(buf, "tobytes"):
-                raw = buf.tobytes()
-            else:
-                raw = bytes(buf)
-            if len(raw) != nbytes:
-                try:
-                    raw = bytes(buf[:nbytes])
-                except Exception:
-                    raw = raw[:nbytes]
-
-        return Image.frombytes("RGBA", (w, h), raw)
+def _open_rgba(path: Path, *, target: Resolution, keep_ratio: bool = False) -> Image.Image:
+    """Decode an image file into a loaded RGBA image headed for `target`.
+
+    JPEGs are decoded at a reduced scale (at least 2x the final size) via
+    simplejpeg when it is installed, otherwise via Pillow's draft mode.
+    """
+
+    if simplejpeg is not None and path.suffix.lower() in _JPEG_SUFFIXES:
+        try:
+            data = path.read_bytes()
+            h, w, _, _ = simplejpeg.decode_jpeg_header(data)
+            tw, th = _fit_size((w, h), target) if keep_ratio else (target.width, target.height)
+            arr = simplejpeg.decode_jpeg(
+                data,
+                colorspace="RGBA",
+                fastdct=True,
+                fastupsample=True,
+                min_width=tw * 2,
+                min_height=th * 2,
+            )
+            return Image.fromarray(arr)
+        except Exception:
+            # Unsupported variant (e.g. CMYK/progressive edge cases): use Pillow.
+            pass
+
+    with Image.open(path) as img:
+        iw, ih = img.size
+        if iw > 0 and ih > 0:
+            tw, th = _fit_size((iw, ih), target) if keep_ratio else (target.width, target.height)
+            _draft_for_target(img, (tw, th))
+        return img.convert("RGBA")
+
+
+@functools.lru_cache(maxsize=1)
+def _qimage_rgba8888():
+    # Resolved once; keeps PySide6 out of this module's import cost.
+    from PySide6.QtGui import QImage
+
+    return QImage, QImage.Format.Format_RGBA8888
+
+
+def _qimage_to_pil(qimage) -> Image.Image:
+    # qimage is a PySide6.QtGui.QImage
+    QImage, rgba8888 = _qimage_rgba8888()
+
+    if not isinstance(qimage, QImage):
+        raise ImageProcessError("Clipboard does not contain an image")
+
+    img = qimage.convertToFormat(rgba8888)
+    w = img.width()
+    h = img.height()
+
+    nbytes = int(img.sizeInBytes())
+    buf = img.constBits() if hasattr(img, "constBits") else img.bits()
+    if hasattr(buf, "setsize"):
+        buf.setsize(nbytes)
+    view = memoryview(buf).cast("B")[:nbytes]
+
+    # frombuffer maps the Qt-owned pixels (honoring the row stride) without
+    # copying. Qt frees that memory together with `img`, so take exactly one
+    # copy while it is still alive.
+    return Image.frombuffer("RGBA", (w, h), view, "raw", "RGBA", img.bytesPerLine(), 1).copy()
+
+
+def pil_from_qimage(qimage) -> Image.Image:
+    try:
+        return _qimage_to_pil(qimage)
     except ImageProcessError:
         raise
     except Exception as e:
         raise ImageProcessError(str(e))
 
 
-def build_overlay_png(
+def build_overlay_image(
     blank_overlay_png: Path,
     bottom: Image.Image,
-    dest: Path,
     *,
     overlay_resolution: Resolution,
     build_resolution: Resolution,
     position: tuple[int, int],
-) -> None:
+) -> Image.Image:
+    """Composite `bottom` under the blank overlay template and return the result.
+
+    Nothing is written to disk, so callers can keep working on the image
+    (or save it themselves) without a PNG encode/decode round-trip.
+    """
+
     try:
         ow, oh = overlay_resolution.width, overlay_resolution.height
         bw, bh = build_resolution.width, build_resolution.height
@@ -73,26 +184,51 @@ def build_overlay_png(
                 f"OverlayBuildPosition {x},{y} places image outside overlay bounds"
             )
 
-        with Image.open(blank_overlay_png) as top:
-            top = top.convert("RGBA")
-            if top.size != (ow, oh):
-                top = top.resize((ow, oh), resample=Image.LANCZOS)
+        top = _cached_rgba(blank_overlay_png, (ow, oh))
 
-        bottom = bottom.convert("RGBA")
+        bottom = _as_rgba(bottom)
         if bottom.size != (bw, bh):
             bottom = bottom.resize((bw, bh), resample=Image.LANCZOS)
 
+        # Compositing over a fully transparent canvas reduces to a straight
+        # copy, so paste() the bottom image (touching only its sub-rectangle)
+        # instead of a full-frame alpha_composite. Do not use the bottom as its
+        # own mask: paste(img, box, img) would also blend the alpha channel
+        # (a*a). The 0/255 mask keeps fully transparent pixels at (0,0,0,0),
+        # as the composite produced, since top's transparent pixels carry the
+        # canvas through to the output.
         canvas = Image.new("RGBA", (ow, oh), (0, 0, 0, 0))
-        canvas.alpha_composite(bottom, dest=(x, y))
+        canvas.paste(bottom, (x, y), bottom.getchannel("A").point(_OPAQUE_MASK_LUT))
         canvas.alpha_composite(top, dest=(0, 0))
-
-        _atomic_png_save(canvas, dest)
+        return canvas
     except ImageProcessError:
         raise
     except Exception as e:
         raise ImageProcessError(str(e))
 
 
+def build_overlay_png(
+    blank_overlay_png: Path,
+    bottom: Image.Image,
+    dest: Path,
+    *,
+    overlay_resolution: Resolution,
+    build_resolution: Resolution,
+    position: tuple[int, int],
+) -> None:
+    canvas = build_overlay_image(
+        blank_overlay_png,
+        bottom,
+        overlay_resolution=overlay_resolution,
+        build_resolution=build_resolution,
+        position=position,
+    )
+    try:
+        _atomic_png_save(canvas, dest)
+    except Exception as e:
+        raise ImageProcessError(str(e))
+
+
 def build_overlay_png_from_file(
     blank_overlay_png: Path,
     bottom_path: Path,
@@ -103,8 +239,7 @@ def build_overlay_png_from_file(
     position: tuple[int, int],
 ) -> None:
     try:
-        with Image.open(bottom_path) as img:
-            bottom = img.convert("RGBA")
+        bottom = _open_rgba(bottom_path, target=build_resolution)
         build_overlay_png(
             blank_overlay_png,
             bottom,
@@ -127,12 +262,12 @@ def get_image_size(path: Path) -> tuple[int, int] | None:
         return None
 
 
-def save_png_resized_from_file(src: Path, dest: Path, *, expected: Resolution) -> None:
+def save_png_resized_from_file(src: Path, dest: Path, *, expected: Resolution, paletted: bool = False) -> None:
     try:
-        with Image.open(src) as img:
-            img = img.convert("RGBA")
+        img = _open_rgba(src, target=expected)
+        if img.size != (expected.width, expected.height):
             img = img.resize((expected.width, expected.height), resample=Image.LANCZOS)
-            _atomic_png_save(img, dest)
+        _atomic_png_save(img, dest, paletted=paletted)
     except Exception as e:
         raise ImageProcessError(str(e))
 
@@ -149,30 +284,27 @@ def save_png_preserve_ratio_centered_on_canvas_from_pil(
 
         canvas: Image.Image
         if canvas_png is not None and canvas_png.exists():
-            with Image.open(canvas_png) as opened:
-                canvas = opened.convert("RGBA")
-                if canvas.size != (ow, oh):
-                    canvas = canvas.resize((ow, oh), resample=Image.LANCZOS)
+            # Copy: the cached template is shared and we draw into `canvas`.
+            canvas = _cached_rgba(canvas_png, (ow, oh)).copy()
         else:
             # Generate a transparent RGBA canvas in code (more robust than depending on an on-disk blank PNG).
             canvas = Image.new("RGBA", (ow, oh), (0, 0, 0, 0))
 
-        img = img.convert("RGBA")
+        img = _as_rgba(img)
         iw, ih = img.size
         if iw <= 0 or ih <= 0:
             raise ImageProcessError("Invalid source image size")
 
-        scale = min(ow / iw, oh / ih)
-        nw = max(1, int(round(iw * scale)))
-        nh = max(1, int(round(ih * scale)))
-        fitted = img.resize((nw, nh), resample=Image.LANCZOS)
+        nw, nh = _fit_size((iw, ih), expected)
+        fitted = img if (nw, nh) == (iw, ih) else img.resize((nw, nh), resample=Image.LANCZOS)
 
         x = int((ow - nw) / 2)
         y = int((oh - nh) / 2)
 
-        out = canvas.copy()
-        out.alpha_composite(fitted, dest=(x, y))
-        _atomic_png_save(out, dest)
+        # `canvas` is owned by this call (freshly created or copied from the
+        # cached template), so composite into it directly.
+        canvas.alpha_composite(fitted, dest=(x, y))
+        _atomic_png_save(canvas, dest)
     except ImageProcessError:
         raise
     except Exception as e:
@@ -187,8 +319,7 @@ def save_png_preserve_ratio_centered_on_canvas_from_file(
     canvas_png: Path | None = None,
 ) -> None:
     try:
-        with Image.open(src) as img:
-            pil = img.convert("RGBA")
+        pil = _open_rgba(src, target=expected, keep_ratio=True)
         save_png_preserve_ratio_centered_on_canvas_from_pil(pil, dest, expected=expected, canvas_png=canvas_png)
     except ImageProcessError:
         raise
@@ -196,11 +327,12 @@ def save_png_preserve_ratio_centered_on_canvas_from_file(
         raise ImageProcessError(str(e))
 
 
-def save_png_resized_from_pil(img: Image.Image, dest: Path, *, expected: Resolution) -> None:
+def save_png_resized_from_pil(img: Image.Image, dest: Path, *, expected: Resolution, paletted: bool = False) -> None:
     try:
-        img = img.convert("RGBA")
-        img = img.resize((expected.width, expected.height), resample=Image.LANCZOS)
-        _atomic_png_save(img, dest)
+        img = _as_rgba(img)
+        if img.size != (expected.width, expected.height):
+            img = img.resize((expected.width, expected.height), resample=Image.LANCZOS)
+        _atomic_png_save(img, dest, paletted=paletted)
     except Exception as e:
         raise ImageProcessError(str(e))
 
@@ -208,35 +340,7 @@ def save_png_resized_from_pil(img: Image.Image, dest: Path, *, expected: Resolut
 def save_png_resized_from_clipboard_qimage(qimage, dest: Path, *, expected: Resolution) -> None:
     # qimage is a PySide6.QtGui.QImage
     try:
-        from PySide6.QtGui import QImage
-
-        if not isinstance(qimage, QImage):
-            raise ImageProcessError("Clipboard does not contain an image")
-
-        img = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
-        w = img.width()
-        h = img.height()
-
-        nbytes = int(img.sizeInBytes())
-        buf = img.bits()
-
-        raw: bytes
-        if hasattr(buf, "setsize"):
-            buf.setsize(nbytes)
-            raw = bytes(buf)
-        else:
-            # PySide6 can return a memoryview-like object with no setsize/setview.
-            if hasattr(buf, "tobytes"):
-                raw = buf.tobytes()
-            else:
-                raw = bytes(buf)
-            if len(raw) != nbytes:
-                try:
-                    raw = bytes(buf[:nbytes])
-                except Exception:
-                    raw = raw[:nbytes]
-
-        pil = Image.frombytes("RGBA", (w, h), raw)
+        pil = _qimage_to_pil(qimage)
         save_png_resized_from_pil(pil, dest, expected=expected)
     except ImageProcessError:
         raise
@@ -246,15 +350,42 @@ def save_png_resized_from_clipboard_qimage(qimage, dest: Path, *, expected: Reso
 
 def generate_qr_png(url: str, dest: Path, *, expected: Resolution) -> None:
     try:
-        qr_img = qrcode.make(url)
+        # Imported on first use: QR generation is rare and qrcode is not
+        # needed at startup.
+        import qrcode
+
+        qr = qrcode.QRCode(box_size=1, border=4)
+        qr.add_data(url)
+        qr.make(fit=True)
+
+        # Render each module as a whole number of pixels and center it on a
+        # white canvas, instead of LANCZOS-scaling a fixed-size render (which
+        # blurs module edges). Only fall back to a NEAREST resize when the
+        # target is smaller than one pixel per module.
+        modules = qr.modules_count + 2 * qr.border
+        box = min(expected.width, expected.height) // modules
+        qr.box_size = max(1, box)
+        qr_img = qr.make_image()
         if not isinstance(qr_img, Image.Image):
             qr_img = qr_img.get_image()
+        qr_img = qr_img.convert("RGBA")
+
+        if box < 1:
+            qr_img = qr_img.resize((expected.width, expected.height), resample=Image.NEAREST)
+        elif qr_img.size != (expected.width, expected.height):
+            canvas = Image.new("RGBA", (expected.width, expected.height), (255, 255, 255, 255))
+            w, h = qr_img.size
+            canvas.paste(qr_img, ((expected.width - w) // 2, (expected.height - h) // 2))
+            qr_img = canvas
         save_png_resized_from_pil(qr_img, dest, expected=expected)
     except Exception as e:
         raise ImageProcessError(str(e))
 
 
-def _atomic_png_save(img: Image.Image, dest: Path) -> None:
+def _atomic_png_save(img: Image.Image, dest: Path, *, paletted: bool = False) -> None:
+    if paletted:
+        # 256-colour palette PNG; FASTOCTREE keeps per-entry alpha (tRNS).
+        img = img.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
     dest.parent.mkdir(parents=True, exist_ok=True)
     tmp = dest.with_name(dest.name + ".tmp")
     if tmp.exists():
@@ -262,5 +393,8 @@ def _atomic_png_save(img: Image.Image, dest: Path) -> None:
             tmp.unlink()
         except Exception:
             pass
-    img.save(tmp, format="PNG")
+    if _png_compress_level is None:
+        img.save(tmp, format="PNG")
+    else:
+        img.save(tmp, format="PNG", compress_level=_png_compress_level)
     tmp.replace(dest)
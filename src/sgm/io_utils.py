@@ -1,17 +1,63 @@
 from __future__ import annotations
 
+import json
+import os
+import re
 import shutil
 import uuid
 from pathlib import Path
+from typing import Any, Iterator
 
-from sgm.scanner import _classify
-from sgm.sprint_fs import sprint_path_key
+from sgm.scanner import _classify_name
+from sgm.sprint_fs import sprint_path_keys
+
+try:
+    # Optional: C JSON parser/serializer, much faster than the stdlib module.
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 
 class RenameCollisionError(RuntimeError):
     pass
 
 
+# A run of 19+ digits may be an integer outside 64 bits, which orjson would
+# silently parse as a float.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+class _StdlibJsonDict(dict):
+    """A JSON object parsed by the stdlib rather than orjson.
+
+    The stdlib allows NaN/Infinity, which orjson would write back as null,
+    so json_dumps() keeps such data on the stdlib serializer.
+    """
+
+
+def json_loads(raw: bytes) -> Any:
+    if orjson is not None and _LONG_DIGITS_RE.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # The stdlib parser is more lenient (e.g. NaN); don't lose such files.
+            pass
+    # json.loads takes the bytes as read and detects the encoding itself.
+    data = json.loads(raw)
+    return _StdlibJsonDict(data) if isinstance(data, dict) else data
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize like json.dumps(indent=2, ensure_ascii=False), UTF-8 encoded."""
+    if orjson is not None and not isinstance(data, _StdlibJsonDict):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejected a value, e.g. an integer wider than 64 bits.
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def copy_file(src: Path, dest: Path, *, overwrite: bool) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     if dest.exists():
@@ -22,16 +68,30 @@ def copy_file(src: Path, dest: Path, *, overwrite: bool) -> None:
     shutil.copy2(src, dest)
 
 
+def _iter_matching(folder: Path, basename: str) -> Iterator[tuple[Path, str]]:
+    """Yield (path, kind) for every file in `folder` that belongs to `basename`.
+
+    Uses os.scandir so the file-type check comes from the directory listing;
+    a Path is only built for matching files.
+    """
+
+    with os.scandir(folder) as it:
+        for de in it:
+            try:
+                if not de.is_file():
+                    continue
+            except OSError:
+                continue
+            base, kind = _classify_name(de.name)
+            if base != basename or kind is None:
+                continue
+            yield folder / de.name, kind
+
+
 def plan_rename_for_game_files(folder: Path, old_basename: str, new_basename: str) -> list[tuple[Path, Path]]:
     moves: list[tuple[Path, Path]] = []
 
-    for entry in folder.iterdir():
-        if not entry.is_file():
-            continue
-        base, kind = _classify(entry)
-        if base != old_basename or kind is None:
-            continue
-
+    for entry, kind in _iter_matching(folder, old_basename):
         new_name = _build_name(new_basename, entry, kind)
         moves.append((entry, folder / new_name))
 
@@ -46,12 +106,7 @@ def plan_rename_for_folder_support_files(parent_folder: Path, old_basename: str,
     """
     moves: list[tuple[Path, Path]] = []
 
-    for entry in parent_folder.iterdir():
-        if not entry.is_file():
-            continue
-        base, kind = _classify(entry)
-        if base != old_basename or kind is None:
-            continue
+    for entry, kind in _iter_matching(parent_folder, old_basename):
         if kind in {"rom", "config"}:
             continue
 
@@ -67,12 +122,7 @@ def plan_move_game_files(src_folder: Path, dest_folder: Path, basename: str) ->
     if not src_folder.exists() or not src_folder.is_dir():
         return moves
 
-    for entry in src_folder.iterdir():
-        if not entry.is_file():
-            continue
-        base, kind = _classify(entry)
-        if base != basename or kind is None:
-            continue
+    for entry, _ in _iter_matching(src_folder, basename):
         moves.append((entry, dest_folder / entry.name))
 
     return moves
@@ -82,21 +132,29 @@ def rename_many(moves: list[tuple[Path, Path]]) -> None:
     if not moves:
         return
 
-    src_keys = {sprint_path_key(s) for s, _ in moves}
+    src_keys = set(sprint_path_keys([s for s, _ in moves]))
+    dst_keys = sprint_path_keys([d for _, d in moves])
 
     # Detect duplicate destinations within the move set.
     seen_dest_keys: set[str] = set()
-    for _, dst in moves:
-        key = sprint_path_key(dst)
+    for (_, dst), key in zip(moves, dst_keys):
         if key in seen_dest_keys:
             raise RenameCollisionError(f"Multiple moves would collide at: {dst}")
         seen_dest_keys.add(key)
 
     # Detect collisions with existing files not part of the rename set.
-    for _, dst in moves:
-        if dst.exists() and sprint_path_key(dst) not in src_keys:
+    for (_, dst), key in zip(moves, dst_keys):
+        if dst.exists() and key not in src_keys:
             raise RenameCollisionError(f"Destination already exists: {dst}")
 
+    # No destination is also a source (keys are case-insensitive, so case-only
+    # renames do not qualify): nothing can be overwritten mid-way, so rename
+    # directly.
+    if src_keys.isdisjoint(dst_keys):
+        for src, dst in moves:
+            src.rename(dst)
+        return
+
     # Use temporary unique names to handle swaps.
     tmp_moves: list[tuple[Path, Path]] = []
     for src, _ in moves:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
@@ -13,8 +14,10 @@ def _bundle_base_dir() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@functools.lru_cache(maxsize=1)
 def resources_dir() -> Path:
     # Prefer a `resources/` folder next to where the app is being run from.
+    # Resolved once per process; every resource_path() call reuses it.
     cwd = Path.cwd() / "resources"
     if cwd.exists():
         return cwd
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import os
+import re
 
 IS_WINDOWS = os.name == "nt"
 
@@ -12,6 +14,26 @@ from sgm.domain import GameAssets, ROM_EXTS, choose_rom
 
 SUPPORTED_EXTS = {".bin", ".int", ".rom", ".cfg", ".json", ".png"}
 
+# PNG asset suffixes (case-insensitive) -> asset kind.
+_PNG_KIND_BY_SUFFIX = {
+    "_big_overlay": "overlay_big",
+    "_overlay2": "overlay2",
+    "_overlay3": "overlay3",
+    "_overlay": "overlay",
+    "_qrcode": "qrcode",
+    "_small": "box_small",
+    "_snap1": "snap1",
+    "_snap2": "snap2",
+    "_snap3": "snap3",
+}
+
+# The lazy base makes the longest matching suffix win, so `_big_overlay`
+# takes precedence over `_overlay`.
+_PNG_KIND_RE = re.compile(
+    r"^(?P<base>.*?)(?P<kind>_big_overlay|_overlay[23]?|_qrcode|_small|_snap[123])$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def _sanitize_basename(basename: str) -> str:
     """Remove apostrophes from basename as they are not supported by Sprint."""
@@ -27,187 +49,238 @@ class ScanResult:
     keyboard_files: list[Path]
 
 
-def scan_folder(folder: Path) -> ScanResult:
-    games: dict[str, GameAssets] = {}
-    folders: dict[str, GameAssets] = {}
-    palette_files: list[Path] = []
-    keyboard_files: list[Path] = []
+@dataclass
+class _DirScan:
+    """Findings from a single directory (no recursion)."""
 
-    if not folder.exists() or not folder.is_dir():
-        return ScanResult(folder=folder, games={}, folders={}, palette_files=[], keyboard_files=[])
+    subdirs: list[tuple[Path, bool]] = field(default_factory=list)
+    games: dict[str, GameAssets] = field(default_factory=dict)
+    folders: dict[str, GameAssets] = field(default_factory=dict)
+    palette_files: list[Path] = field(default_factory=list)
+    keyboard_files: list[Path] = field(default_factory=list)
 
-    def is_hidden_dir(p: Path) -> bool:
-        name = p.name
-        if name.startswith("."):
-            return True
-        if IS_WINDOWS:
-            try:
-                import ctypes
-
-                # https://learn.microsoft.com/windows/win32/api/fileapi/nf-fileapi-getfileattributesw
-                # INVALID_FILE_ATTRIBUTES == 0xFFFFFFFF
-                attrs = ctypes.windll.kernel32.GetFileAttributesW(str(p))
-                if attrs in (-1, 0xFFFFFFFF, 4294967295):
-                    return False
-                FILE_ATTRIBUTE_HIDDEN = 0x2
-                return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
-            except Exception:
-                return False
-        return False
 
-    def is_hidden_file(p: Path) -> bool:
-        # Keep this simple: dot-files are hidden.
-        # Note: we still traverse hidden directories for helper file discovery
-        # (palette/.kbd), so we do not rely on Windows hidden attributes here.
-        return p.name.startswith(".")
+# Directory listings are I/O-bound (network shares, USB drives), so sibling
+# directories are listed concurrently.
+_SCAN_WORKERS = 8
 
-    # Custom walk so we can prune hidden dirs for game discovery,
-    # but still traverse them to find helper files (palette/.kbd).
-    #
-    # allow_games=False means: do NOT discover games or folder-supporting assets
-    # from this subtree; only collect helper files.
-    stack: list[tuple[Path, bool]] = [(folder, True)]
-    while stack:
-        cur, allow_games = stack.pop()
+
+def _is_hidden_dir(p: Path) -> bool:
+    name = p.name
+    if name.startswith("."):
+        return True
+    if IS_WINDOWS:
         try:
-            entries = list(cur.iterdir())
+            import ctypes
+
+            # https://learn.microsoft.com/windows/win32/api/fileapi/nf-fileapi-getfileattributesw
+            # INVALID_FILE_ATTRIBUTES == 0xFFFFFFFF
+            attrs = ctypes.windll.kernel32.GetFileAttributesW(str(p))
+            if attrs in (-1, 0xFFFFFFFF, 4294967295):
+                return False
+            FILE_ATTRIBUTE_HIDDEN = 0x2
+            return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
         except Exception:
-            continue
+            return False
+    return False
 
-        dir_names: set[str] = set()
-        if allow_games:
-            # Pre-scan child directories so we can treat sibling files with the same
-            # basename as folder-supporting assets (not games).
-            for entry in entries:
-                if not entry.is_dir():
-                    continue
-                if is_hidden_dir(entry):
-                    # Hidden directories should not contribute to game discovery,
-                    # but we still walk them for helper files.
-                    stack.append((entry, False))
-                    continue
-                dir_names.add(entry.name)
-                stack.append((entry, True))
-        else:
+
+def _is_hidden_file(name: str) -> bool:
+    # Keep this simple: dot-files are hidden.
+    # Note: we still traverse hidden directories for helper file discovery
+    # (palette/.kbd), so we do not rely on Windows hidden attributes here.
+    return name.startswith(".")
+
+
+def _scan_dir(root: Path, cur: Path, allow_games: bool) -> _DirScan:
+    """Scan one directory.
+
+    allow_games=False means: do NOT discover games or folder-supporting assets
+    from this directory; only collect helper files.
+    """
+
+    out = _DirScan()
+    try:
+        # DirEntry caches the file type from the directory listing, so the
+        # is_dir()/is_file() checks below do not need a stat() per entry.
+        with os.scandir(cur) as it:
+            entries = list(it)
+    except Exception:
+        return out
+
+    files: list[os.DirEntry] = []
+    dir_names: set[str] = set()
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if not is_dir:
+            files.append(entry)
+            continue
+        sub = cur / entry.name
+        if not allow_games:
             # Helper-only mode: traverse the subtree, but never discover games/assets.
-            for entry in entries:
-                if entry.is_dir():
-                    stack.append((entry, False))
+            out.subdirs.append((sub, False))
+        elif _is_hidden_dir(sub):
+            # Hidden directories should not contribute to game discovery,
+            # but we still walk them for helper files.
+            out.subdirs.append((sub, False))
+        else:
+            # Track child directories so we can treat sibling files with the same
+            # basename as folder-supporting assets (not games).
+            dir_names.add(entry.name)
+            out.subdirs.append((sub, True))
 
-        for entry in entries:
-            if entry.is_dir():
-                continue
-            if not entry.is_file():
-                continue
-            if is_hidden_file(entry):
+    rel_key_prefix = ""
+    if allow_games:
+        try:
+            rel_folder = cur.relative_to(root)
+        except Exception:
+            rel_folder = Path(".")
+        # Unique key: include folder path when game is in a subfolder.
+        if str(rel_folder) not in {".", ""}:
+            rel_key_prefix = f"{rel_folder.as_posix()}/"
+
+    for de in files:
+        name = de.name
+        if _is_hidden_file(name):
+            continue
+        try:
+            if not de.is_file():
                 continue
+        except OSError:
+            continue
 
-            suffix = entry.suffix.lower()
+        # Work on the plain name; a Path is only built for files we keep.
+        stem, suffix = _split_name(name)
+        suffix = suffix.lower()
 
-            # Track helper files used by Advanced JSON settings.
-            # Palette files: .cfg or .txt containing "palette" anywhere in the filename.
-            if suffix in {".cfg", ".txt"} and "palette" in entry.name.casefold():
-                palette_files.append(entry)
+        # Track helper files used by Advanced JSON settings.
+        # Palette files: .cfg or .txt containing "palette" anywhere in the filename.
+        is_palette = suffix in {".cfg", ".txt"} and "palette" in name.casefold()
+        if is_palette:
+            out.palette_files.append(cur / name)
 
-            # Keyboard hack files.
-            if suffix == ".kbd":
-                keyboard_files.append(entry)
+        # Keyboard hack files.
+        if suffix == ".kbd":
+            out.keyboard_files.append(cur / name)
 
-            if not allow_games:
-                continue
-            if suffix not in SUPPORTED_EXTS:
-                continue
+        if not allow_games:
+            continue
+        if suffix not in SUPPORTED_EXTS:
+            continue
 
-            base, kind = _classify(entry)
-            if base is None or kind is None:
-                continue
+        base, kind = _classify_split(stem, suffix, is_palette)
+        if base is None or kind is None:
+            continue
 
-            # Folder-supporting assets live alongside a folder whose name is <basename>.
-            # These should not appear as games.
-            if base in dir_names:
-                # ROM and CFG do not apply to folders.
-                if kind in {"rom", "config"}:
-                    continue
-
-                folder_dir = cur / base
-                fkey = str(folder_dir)
-                asset = folders.get(fkey)
-                if asset is None:
-                    asset = GameAssets(basename=base, folder=cur)
-                    folders[fkey] = asset
-
-                if kind == "metadata":
-                    asset.metadata = entry
-                elif kind == "box":
-                    asset.box = entry
-                elif kind == "box_small":
-                    asset.box_small = entry
-                elif kind == "overlay":
-                    asset.overlay = entry
-                elif kind == "overlay2":
-                    asset.overlay2 = entry
-                elif kind == "overlay3":
-                    asset.overlay3 = entry
-                elif kind == "overlay_big":
-                    asset.overlay_big = entry
-                elif kind == "qrcode":
-                    asset.qrcode = entry
-                elif kind == "snap1":
-                    asset.snap1 = entry
-                elif kind == "snap2":
-                    asset.snap2 = entry
-                elif kind == "snap3":
-                    asset.snap3 = entry
-                else:
-                    asset.other.append(entry)
+        entry = cur / name
+
+        # Folder-supporting assets live alongside a folder whose name is <basename>.
+        # These should not appear as games.
+        if base in dir_names:
+            # ROM and CFG do not apply to folders.
+            if kind in {"rom", "config"}:
                 continue
 
-            game_folder = entry.parent
-            rel_folder = Path(".")
-            try:
-                rel_folder = game_folder.relative_to(folder)
-            except Exception:
-                rel_folder = Path(".")
-
-            # Unique key: include folder path when game is in a subfolder.
-            if str(rel_folder) in {".", ""}:
-                key = base
-            else:
-                key = f"{rel_folder.as_posix()}/{base}"
-
-            game = games.get(key)
-            if game is None:
-                game = GameAssets(basename=base, folder=game_folder)
-                games[key] = game
-
-            if kind == "rom":
-                game.rom = choose_rom(game.rom, entry)
-            elif kind == "config":
-                game.config = entry
-            elif kind == "metadata":
-                game.metadata = entry
+            folder_dir = cur / base
+            fkey = str(folder_dir)
+            asset = out.folders.get(fkey)
+            if asset is None:
+                asset = GameAssets(basename=base, folder=cur)
+                out.folders[fkey] = asset
+
+            if kind == "metadata":
+                asset.metadata = entry
             elif kind == "box":
-                game.box = entry
+                asset.box = entry
             elif kind == "box_small":
-                game.box_small = entry
+                asset.box_small = entry
             elif kind == "overlay":
-                game.overlay = entry
+                asset.overlay = entry
             elif kind == "overlay2":
-                game.overlay2 = entry
+                asset.overlay2 = entry
             elif kind == "overlay3":
-                game.overlay3 = entry
+                asset.overlay3 = entry
             elif kind == "overlay_big":
-                game.overlay_big = entry
+                asset.overlay_big = entry
             elif kind == "qrcode":
-                game.qrcode = entry
+                asset.qrcode = entry
             elif kind == "snap1":
-                game.snap1 = entry
+                asset.snap1 = entry
             elif kind == "snap2":
-                game.snap2 = entry
+                asset.snap2 = entry
             elif kind == "snap3":
-                game.snap3 = entry
+                asset.snap3 = entry
             else:
-                game.other.append(entry)
+                asset.other.append(entry)
+            continue
+
+        key = rel_key_prefix + base
+        game = out.games.get(key)
+        if game is None:
+            game = GameAssets(basename=base, folder=cur)
+            out.games[key] = game
+
+        if kind == "rom":
+            game.rom = choose_rom(game.rom, entry)
+        elif kind == "config":
+            game.config = entry
+        elif kind == "metadata":
+            game.metadata = entry
+        elif kind == "box":
+            game.box = entry
+        elif kind == "box_small":
+            game.box_small = entry
+        elif kind == "overlay":
+            game.overlay = entry
+        elif kind == "overlay2":
+            game.overlay2 = entry
+        elif kind == "overlay3":
+            game.overlay3 = entry
+        elif kind == "overlay_big":
+            game.overlay_big = entry
+        elif kind == "qrcode":
+            game.qrcode = entry
+        elif kind == "snap1":
+            game.snap1 = entry
+        elif kind == "snap2":
+            game.snap2 = entry
+        elif kind == "snap3":
+            game.snap3 = entry
+        else:
+            game.other.append(entry)
+
+    return out
+
+
+def scan_folder(folder: Path) -> ScanResult:
+    games: dict[str, GameAssets] = {}
+    folders: dict[str, GameAssets] = {}
+    palette_files: list[Path] = []
+    keyboard_files: list[Path] = []
+
+    if not folder.exists() or not folder.is_dir():
+        return ScanResult(folder=folder, games={}, folders={}, palette_files=[], keyboard_files=[])
+
+    # Custom walk so we can prune hidden dirs for game discovery,
+    # but still traverse them to find helper files (palette/.kbd).
+    #
+    # Each directory is scanned independently (game keys and folder keys are
+    # unique per directory), so a whole level of the tree is listed in
+    # parallel and the per-directory results are merged here.
+    level: list[tuple[Path, bool]] = [(folder, True)]
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        while level:
+            next_level: list[tuple[Path, bool]] = []
+            for part in pool.map(lambda item: _scan_dir(folder, item[0], item[1]), level):
+                next_level.extend(part.subdirs)
+                games.update(part.games)
+                folders.update(part.folders)
+                palette_files.extend(part.palette_files)
+                keyboard_files.extend(part.keyboard_files)
+            level = next_level
 
     # Stable ordering for UI
     games = dict(sorted(games.items(), key=lambda kv: kv[0].lower()))
@@ -217,16 +290,38 @@ def scan_folder(folder: Path) -> ScanResult:
     return ScanResult(folder=folder, games=games, folders=folders, palette_files=palette_files, keyboard_files=keyboard_files)
 
 
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a file name into (stem, suffix) exactly like Path.stem/Path.suffix."""
+
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ""
+
+
 def _classify(path: Path) -> tuple[str | None, str | None]:
-    suffix = path.suffix.lower()
-    stem = path.stem
+    return _classify_name(path.name)
+
+
+def _classify_name(name: str) -> tuple[str | None, str | None]:
+    stem, suffix = _split_name(name)
+    suffix = suffix.lower()
+    return _classify_split(stem, suffix, suffix == ".cfg" and "palette" in name.casefold())
+
+
+def _classify_split(stem: str, suffix: str, is_palette: bool) -> tuple[str | None, str | None]:
+    """Classify a file from its pre-split parts.
 
+    `suffix` must already be lowercased; `is_palette` says whether the file
+    name contains "palette" (case-insensitive). Lets the scanner reuse work it
+    has already done for each entry.
+    """
     if suffix in ROM_EXTS:
         return _sanitize_basename(stem), "rom"
     if suffix == ".cfg":
         # Some games folders include palette/config helper files that are not game configs.
         # If the filename contains "palette" anywhere, ignore it for game discovery.
-        if "palette" in path.name.casefold():
+        if is_palette:
             return None, None
         return _sanitize_basename(stem), "config"
     if suffix == ".json":
@@ -234,25 +329,9 @@ def _classify(path: Path) -> tuple[str | None, str | None]:
     if suffix != ".png":
         return None, None
 
-    lower = stem.lower()
-
-    if lower.endswith("_big_overlay"):
-        return _sanitize_basename(stem[: -len("_big_overlay")]), "overlay_big"
-    if lower.endswith("_overlay2"):
-        return _sanitize_basename(stem[: -len("_overlay2")]), "overlay2"
-    if lower.endswith("_overlay3"):
-        return _sanitize_basename(stem[: -len("_overlay3")]), "overlay3"
-    if lower.endswith("_overlay"):
-        return _sanitize_basename(stem[: -len("_overlay")]), "overlay"
-    if lower.endswith("_qrcode"):
-        return _sanitize_basename(stem[: -len("_qrcode")]), "qrcode"
-    if lower.endswith("_small"):
-        return _sanitize_basename(stem[: -len("_small")]), "box_small"
-
-    for i in (1, 2, 3):
-        token = f"_snap{i}"
-        if lower.endswith(token):
-            return _sanitize_basename(stem[: -len(token)]), f"snap{i}"
+    m = _PNG_KIND_RE.match(stem)
+    if m is not None:
+        return _sanitize_basename(m.group("base")), _PNG_KIND_BY_SUFFIX[m.group("kind").lower()]
 
     # Default .png with no recognized suffix is box art.
     return _sanitize_basename(stem), "box"
@@ -41,3 +41,30 @@ def sprint_path_key(path: Path | str | None) -> str:
     s = s.replace("\\", "/")
     s = unicodedata.normalize("NFC", s)
     return s.casefold()
+
+
+def sprint_path_keys(paths: list[Path]) -> list[str]:
+    """Return `sprint_path_key` for many paths, resolving each parent folder once.
+
+    Batches usually share one or two folders, so resolving every full path
+    separately repeats the same realpath work. Symlinked files are still
+    resolved individually so their keys match `sprint_path_key`.
+    """
+
+    parent_keys: dict[str, str] = {}
+    out: list[str] = []
+    for path in paths:
+        p = Path(path)
+        name = p.name
+        if not name or name in {".", ".."} or p.is_symlink():
+            out.append(sprint_path_key(p))
+            continue
+
+        parent = str(p.parent)
+        pkey = parent_keys.get(parent)
+        if pkey is None:
+            pkey = sprint_path_key(p.parent)
+            parent_keys[parent] = pkey
+        sep = "" if pkey.endswith("/") else "/"
+        out.append(pkey + sep + unicodedata.normalize("NFC", name).casefold())
+    return out
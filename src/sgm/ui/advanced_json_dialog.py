@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
+import functools
+import operator
+import re
 import shlex
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 
-from PySide6.QtCore import QSignalBlocker, Qt
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QStandardItemModel
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -24,9 +26,27 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from sgm.io_utils import json_dumps, json_loads
 
 DEFAULT_MEDIA_PREFIX = "/media/usb0"
 
+# jzintv_extra flags managed by the combos rather than the "Other flags" list.
+_KBD_FLAG = "--kbdhackfile="
+_PAL_FLAG = "--gfx-palette="
+_COMBO_FLAGS = (_KBD_FLAG, _PAL_FLAG)
+_KBD_FLAG_LEN = len(_KBD_FLAG)
+_PAL_FLAG_LEN = len(_PAL_FLAG)
+
+# Combo changes are written after this quiet period, so scrolling through a
+# combo with the arrow keys doesn't rewrite the JSON for every entry.
+_COMBO_WRITE_DELAY_MS = 150
+
+# Matches exactly the characters str.isspace() accepts, but the scan runs in C.
+_WHITESPACE_RE = re.compile(r"\s")
+
+# Characters that shlex (posix, whitespace_split) treats specially.
+_SHELL_META = frozenset(" \t\r\n'\"\\")
+
 
 def _normalize_media_prefix(prefix: str | None) -> str:
     s = (prefix or "").strip() or DEFAULT_MEDIA_PREFIX
@@ -34,26 +54,49 @@ def _normalize_media_prefix(prefix: str | None) -> str:
     return s or DEFAULT_MEDIA_PREFIX
 
 
+def _has_ws(s: str) -> bool:
+    return _WHITESPACE_RE.search(s) is not None
+
+
 def _load_json_dict(path: Path) -> dict:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json_loads(path.read_bytes())
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
 
 
-def _write_json_dict(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+def _write_json_dict(path: Path, data: dict, *, previous: str | None = None) -> str | None:
+    """Write `data` to `path` unless it serializes to `previous`.
+
+    Returns the text written, or None if the write was skipped.
+    """
+    text = json_dumps(data).decode("utf-8") + "\n"
+    if text == previous:
+        return None
+    path.write_text(text, encoding="utf-8")
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _shell_split(s: str) -> tuple[str, ...] | None:
+    # Single cached entry point for shlex: the jzintv_extra string is re-split
+    # after every edit and each of its tokens is re-checked by the helpers
+    # below, so most calls are repeats. Returns None if `s` does not parse.
+    try:
+        return tuple(shlex.split(s, posix=True))
+    except Exception:
+        return None
 
 
-def _split_flags(value: str) -> list[str]:
+def _split_flags(value: str) -> tuple[str, ...]:
     s = (value or "").strip()
     if not s:
-        return []
-    try:
-        return shlex.split(s, posix=True)
-    except Exception:
-        return [t for t in s.split(" ") if t.strip()]
+        return ()
+    parts = _shell_split(s)
+    if parts is None:
+        return tuple(t for t in s.split(" ") if t.strip())
+    return parts
 
 
 def _strip_wrapping_quotes(s: str) -> str:
@@ -63,32 +106,17 @@ def _strip_wrapping_quotes(s: str) -> str:
 
     # Accept both single- and double-quoted strings, including cases where the
     # user entered a shell-quoted token (e.g. via shlex.quote).
-    try:
-        parts = shlex.split(s, posix=True)
-        if len(parts) == 1:
-            return parts[0]
-    except Exception:
-        pass
+    parts = _shell_split(s)
+    if parts is not None and len(parts) == 1:
+        return parts[0]
 
     if len(s) >= 2 and ((s[0] == s[-1] == '"') or (s[0] == s[-1] == "'")):
         return s[1:-1]
     return s
 
 
-def _find_equals_flag_value(tokens: list[str], flag_prefix: str) -> str | None:
-    # Supports tokens like: --flag=value
-    for t in tokens:
-        if t.startswith(flag_prefix):
-            return t[len(flag_prefix) :]
-    return None
-
-
-def _remove_equals_flag(tokens: list[str], flag_prefix: str) -> list[str]:
-    return [t for t in tokens if not t.startswith(flag_prefix)]
-
-
 def _quote_if_spaces(path_str: str) -> str:
-    if any(ch.isspace() for ch in path_str):
+    if _has_ws(path_str):
         # Default to single quotes for shell-style quoting.
         return shlex.quote(path_str)
     return path_str
@@ -98,10 +126,11 @@ def _is_single_shell_token(s: str) -> bool:
     s = (s or "").strip()
     if not s:
         return True
-    try:
-        return len(shlex.split(s, posix=True)) == 1
-    except Exception:
-        return False
+    # Without whitespace, quotes or escapes shlex can only produce one token.
+    if _SHELL_META.isdisjoint(s):
+        return True
+    parts = _shell_split(s)
+    return parts is not None and len(parts) == 1
 
 
 def _normalize_other_flag_token(token: str) -> str:
@@ -118,23 +147,58 @@ def _normalize_other_flag_token(token: str) -> str:
     t = (token or "").strip()
     if not t:
         return ""
-    if not any(ch.isspace() for ch in t):
+    if not _has_ws(t):
         return t
 
     # If the token is already quoted such that it's a single shell token, keep it.
     if _is_single_shell_token(t):
         return t
 
-    if "=" in t:
-        left, right = t.split("=", 1)
-        # Only quote the value if there's actually a value.
-        if right.strip() != "":
-            return f"{left}={shlex.quote(right)}"
+    left, sep, right = t.partition("=")
+    # Only quote the value if there's actually a value.
+    if sep and right.strip() != "":
+        return f"{left}={shlex.quote(right)}"
 
     # Fallback: quote the whole token.
     return shlex.quote(t)
 
 
+def _split_joined_tokens(tokens: list[str]) -> tuple[str, ...] | None:
+    """Return _split_flags(" ".join(tokens)) from the per-token splits.
+
+    Only valid when every token is exactly one shell word with no outer
+    whitespace; returns None otherwise. The per-token splits are cached, and most tokens survive from
+    one edit to the next, so this avoids re-tokenizing the whole string.
+    """
+    out: list[str] = []
+    for t in tokens:
+        if t != t.strip():
+            # Outer whitespace can change meaning once the joined string is stripped.
+            return None
+        parts = _shell_split(t)
+        if parts is None or len(parts) != 1:
+            return None
+        out.append(parts[0])
+    return tuple(out)
+
+
+def _is_listed_form(flag: str) -> bool:
+    """True if `flag` is exactly how _sync_from_json would list it.
+
+    Lets flag edits update the list widget in place instead of rebuilding it.
+    """
+    parts = _split_flags(flag)
+    return (
+        len(parts) == 1
+        and not parts[0].startswith(_COMBO_FLAGS)
+        and _normalize_other_flag_token(parts[0]) == flag
+    )
+
+
+# The two mapping helpers below expect `media_prefix` to already be
+# normalized (see _normalize_media_prefix); the dialog does that once.
+
+
 def _local_to_device_path(*, root: Path, local_path: Path, media_prefix: str) -> str:
     try:
         rel = local_path.relative_to(root)
@@ -143,19 +207,18 @@ def _local_to_device_path(*, root: Path, local_path: Path, media_prefix: str) ->
 
     # On device, paths are posix.
     rel_posix = PurePosixPath(rel.as_posix())
-    prefix = _normalize_media_prefix(media_prefix)
-    return _quote_if_spaces(prefix + "/" + str(rel_posix))
+    return _quote_if_spaces(media_prefix + "/" + str(rel_posix))
 
 
 def _device_to_local_path(*, root: Path, device_path: str, media_prefix: str) -> Path | None:
     s = _strip_wrapping_quotes(device_path)
-    prefix = _normalize_media_prefix(media_prefix)
+    prefix = media_prefix
     if s == prefix:
         return root
     if s.startswith(prefix + "/"):
         rel = s[len(prefix) + 1 :]
         if rel:
-            return root / Path(PurePosixPath(rel))
+            return root.joinpath(*rel.split("/"))
         return root
     # If it isn't /media/usb0, we can't reliably map.
     return None
@@ -163,12 +226,10 @@ def _device_to_local_path(*, root: Path, device_path: str, media_prefix: str) ->
 
 def _combo_add_disabled_blank(combo: QComboBox) -> None:
     # Add a disabled blank item used to represent "no selection".
+    combo.insertItem(0, "")
     model = combo.model()
-    if not isinstance(model, QStandardItemModel):
-        return
-    item = QStandardItem("")
-    item.setEnabled(False)
-    model.insertRow(0, item)
+    if isinstance(model, QStandardItemModel):
+        model.item(0).setEnabled(False)
 
 
 @dataclass(frozen=True)
@@ -197,10 +258,25 @@ class AdvancedJsonDialog(QDialog):
         self._media_prefix = _normalize_media_prefix(media_prefix)
         self._on_written = on_written
 
+        # Path mapping only depends on (root, media_prefix), which are fixed
+        # for the dialog's lifetime.
+        self._dev2local_cache: dict[str, Path | None] = {}
+        self._local2dev_cache: dict[Path, str] = {}
+
         self._palette_options = self._build_file_options(palette_files)
         self._keyboard_options = self._build_file_options(keyboard_files)
 
         self._data: dict = _load_json_dict(self._json_path)
+        # Last text this dialog wrote, to skip rewrites that change nothing.
+        self._last_written: str | None = None
+        # jzintv_extra the UI was last synced to; see _sync_from_json.
+        self._last_synced_extra: str | None = None
+
+        self._combo_write_pending = False
+        self._combo_write_timer = QTimer(self)
+        self._combo_write_timer.setSingleShot(True)
+        self._combo_write_timer.setInterval(_COMBO_WRITE_DELAY_MS)
+        self._combo_write_timer.timeout.connect(self._flush_pending)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -263,8 +339,10 @@ class AdvancedJsonDialog(QDialog):
         self._lbl_palette_missing.setStyleSheet("color: red;")
         self._lbl_palette_missing.setVisible(False)
 
-        self._populate_combo(self._cmb_kbd, self._keyboard_options)
-        self._populate_combo(self._cmb_palette, self._palette_options)
+        self._kbd_index = self._populate_combo(self._cmb_kbd, self._keyboard_options)
+        self._palette_index = self._populate_combo(self._cmb_palette, self._palette_options)
+        # Resolved-path -> index maps, only built if a display lookup misses.
+        self._resolved_index: dict[str, dict[Path, int]] = {}
 
         if not self._keyboard_options:
             self._cmb_kbd.setEnabled(False)
@@ -320,25 +398,51 @@ class AdvancedJsonDialog(QDialog):
         self._sync_from_json()
 
     def _build_file_options(self, paths: list[Path]) -> list[_FileOption]:
-        opts: list[_FileOption] = []
+        # Decorate with the sort key while building, then sort on it with a C
+        # key function; stable, so ties keep their input order as before.
+        keyed: list[tuple[str, _FileOption]] = []
         for p in paths:
             try:
                 rel = p.relative_to(self._root)
                 display = rel.as_posix()
             except Exception:
                 display = str(p)
-            opts.append(_FileOption(display=display, path=p))
-        opts.sort(key=lambda o: o.display.casefold())
-        return opts
-
-    def _populate_combo(self, combo: QComboBox, opts: list[_FileOption]) -> None:
-        combo.setModel(QStandardItemModel())
-        _combo_add_disabled_blank(combo)
-        combo.addItem("Default", None)
-        for o in opts:
-            combo.addItem(o.display, o.path)
-
-    def _sync_from_json(self) -> None:
+            keyed.append((display.casefold(), _FileOption(display=display, path=p)))
+        keyed.sort(key=operator.itemgetter(0))
+        return [o for _, o in keyed]
+
+    def _populate_combo(self, combo: QComboBox, opts: list[_FileOption]) -> dict[str, int]:
+        """Fill `combo` with `opts` and return a display -> index map."""
+        index: dict[str, int] = {}
+        # Selection is set by _sync_from_json; don't emit change signals or
+        # repaint for every intermediate item.
+        with QSignalBlocker(combo):
+            combo.setModel(QStandardItemModel())
+            view = combo.view()
+            view.setUpdatesEnabled(False)
+            try:
+                _combo_add_disabled_blank(combo)
+                combo.addItem("Default", None)
+                for o in opts:
+                    index.setdefault(o.display, combo.count())
+                    combo.addItem(o.display, o.path)
+            finally:
+                view.setUpdatesEnabled(True)
+        return index
+
+    def _sync_from_json(
+        self,
+        *,
+        rebuild_list: bool = True,
+        known_split: tuple[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """Refresh the UI from self._data.
+
+        Pass rebuild_list=False when the "Other flags" list has already been
+        updated in place and matches the JSON. `known_split` is an
+        (extra, _split_flags(extra)) pair the caller already has; it is used
+        instead of re-splitting if `extra` is still the current value.
+        """
         # save_highscores
         has_save = isinstance(self._data, dict) and ("save_highscores" in self._data)
         self._btn_add_save.setEnabled(not has_save)
@@ -356,11 +460,32 @@ class AdvancedJsonDialog(QDialog):
             extra_val = self._data.get("jzintv_extra")
             extra = str(extra_val) if extra_val is not None else ""
 
-        tokens = _split_flags(extra)
+        if extra == self._last_synced_extra:
+            # e.g. a save_highscores change, or a combo change that
+            # round-tripped: the combos, warnings and list already match.
+            self._update_flag_buttons()
+            return
+        self._last_synced_extra = extra
 
-        # Specialized flags
-        kbd_val = _find_equals_flag_value(tokens, "--kbdhackfile=")
-        pal_val = _find_equals_flag_value(tokens, "--gfx-palette=")
+        if known_split is not None and known_split[0] == extra:
+            tokens = known_split[1]
+        else:
+            tokens = _split_flags(extra)
+
+        # Sort tokens into the specialized flags (first occurrence wins) and
+        # everything else in one pass.
+        kbd_val: str | None = None
+        pal_val: str | None = None
+        other: list[str] = []
+        for t in tokens:
+            if t.startswith(_KBD_FLAG):
+                if kbd_val is None:
+                    kbd_val = t[_KBD_FLAG_LEN:]
+            elif t.startswith(_PAL_FLAG):
+                if pal_val is None:
+                    pal_val = t[_PAL_FLAG_LEN:]
+            elif rebuild_list:
+                other.append(_normalize_other_flag_token(t))
 
         with QSignalBlocker(self._cmb_kbd):
             self._set_combo_from_flag(self._cmb_kbd, kbd_val)
@@ -370,32 +495,58 @@ class AdvancedJsonDialog(QDialog):
         self._update_missing_file_warnings(kbd_val=kbd_val, pal_val=pal_val)
 
         # Other flags list
-        other = [t for t in tokens if not (t.startswith("--kbdhackfile=") or t.startswith("--gfx-palette="))]
-        other = [_normalize_other_flag_token(t) for t in other]
-        self._list_flags.clear()
-        for t in other:
-            if not str(t).strip():
-                continue
-            item = QListWidgetItem(t)
-            item.setData(Qt.ItemDataRole.UserRole, t)
-            self._list_flags.addItem(item)
-
+        if rebuild_list:
+            lst = self._list_flags
+            lst.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(lst):
+                    lst.clear()
+                    for t in other:
+                        if not str(t).strip():
+                            continue
+                        item = QListWidgetItem(t)
+                        item.setData(Qt.ItemDataRole.UserRole, t)
+                        lst.addItem(item)
+            finally:
+                lst.setUpdatesEnabled(True)
+
+        self._refresh_derived_ui(extra)
+
+    def _refresh_derived_ui(self, extra: str) -> None:
         self._lbl_full.setText(extra.strip())
         self._update_flag_buttons()
 
+    def _dev_to_local(self, device_path: str) -> Path | None:
+        try:
+            return self._dev2local_cache[device_path]
+        except KeyError:
+            pass
+        local = _device_to_local_path(root=self._root, device_path=device_path, media_prefix=self._media_prefix)
+        self._dev2local_cache[device_path] = local
+        return local
+
+    def _local_to_dev(self, local_path: Path) -> str:
+        try:
+            return self._local2dev_cache[local_path]
+        except KeyError:
+            pass
+        dev = _local_to_device_path(root=self._root, local_path=local_path, media_prefix=self._media_prefix)
+        self._local2dev_cache[local_path] = dev
+        return dev
+
     def _update_missing_file_warnings(self, *, kbd_val: str | None, pal_val: str | None) -> None:
         # If JSON references a file that does not exist locally, show a red warning.
         self._lbl_kbd_missing.setVisible(False)
         self._lbl_palette_missing.setVisible(False)
 
         if kbd_val is not None:
-            local = _device_to_local_path(root=self._root, device_path=kbd_val, media_prefix=self._media_prefix)
+            local = self._dev_to_local(kbd_val)
             if local is None or not local.exists():
                 self._lbl_kbd_missing.setText(f"Warning: referenced keyboard file does not exist: {kbd_val}")
                 self._lbl_kbd_missing.setVisible(True)
 
         if pal_val is not None:
-            local = _device_to_local_path(root=self._root, device_path=pal_val, media_prefix=self._media_prefix)
+            local = self._dev_to_local(pal_val)
             if local is None or not local.exists():
                 self._lbl_palette_missing.setText(f"Warning: referenced palette file does not exist: {pal_val}")
                 self._lbl_palette_missing.setVisible(True)
@@ -411,24 +562,54 @@ class AdvancedJsonDialog(QDialog):
             combo.setCurrentIndex(1)
             return
 
-        local = _device_to_local_path(root=self._root, device_path=value, media_prefix=self._media_prefix)
+        local = self._dev_to_local(value)
         if local is None:
             combo.setCurrentIndex(0)
             return
 
-        # Find matching option.
-        for i in range(combo.count()):
-            p = combo.itemData(i)
-            if isinstance(p, Path) and p.resolve() == local.resolve():
-                combo.setCurrentIndex(i)
-                return
-
-        combo.setCurrentIndex(0)
+        # Options are displayed relative to the root, so the common case is a
+        # plain string lookup; only fall back to resolving symlinks etc. when
+        # that misses.
+        is_kbd = combo is self._cmb_kbd
+        index = self._kbd_index if is_kbd else self._palette_index
+        try:
+            idx = index.get(local.relative_to(self._root).as_posix())
+        except ValueError:
+            idx = None
+        if idx is None:
+            resolved = self._resolved_index_for(is_kbd)
+            idx = resolved.get(local.resolve(), 0)
+        combo.setCurrentIndex(idx)
+
+    def _resolved_index_for(self, is_kbd: bool) -> dict[Path, int]:
+        key = "kbd" if is_kbd else "palette"
+        index = self._resolved_index.get(key)
+        if index is None:
+            opts = self._keyboard_options if is_kbd else self._palette_options
+            index = {}
+            # Options start at index 2, see _populate_combo.
+            for i, o in enumerate(opts, start=2):
+                try:
+                    index.setdefault(o.path.resolve(), i)
+                except Exception:
+                    pass
+            self._resolved_index[key] = index
+        return index
+
+    def done(self, r: int) -> None:
+        self._flush_pending()
+        super().done(r)
 
     def _write(self) -> None:
+        # Land a pending combo change first so it is not lost, or reverted by
+        # the _sync_from_json that follows this write.
+        self._flush_pending()
         if not isinstance(self._data, dict):
             self._data = {}
-        _write_json_dict(self._json_path, self._data)
+        text = _write_json_dict(self._json_path, self._data, previous=self._last_written)
+        if text is None:
+            return
+        self._last_written = text
         if self._on_written is not None:
             try:
                 self._on_written()
@@ -475,27 +656,33 @@ class AdvancedJsonDialog(QDialog):
             return []
         extra_val = self._data.get("jzintv_extra")
         extra = str(extra_val) if extra_val is not None else ""
-        tokens = _split_flags(extra)
-        # Normalize: strip specialized flags we'll rebuild from UI
-        tokens = _remove_equals_flag(tokens, "--kbdhackfile=")
-        tokens = _remove_equals_flag(tokens, "--gfx-palette=")
-        # Ensure other flags remain single shell tokens even if shlex stripped quotes.
-        return [_normalize_other_flag_token(t) for t in tokens]
-
-    def _rebuild_extra_and_write(self, *, kbd: Path | None, palette: Path | None, other_flags: list[str]) -> None:
+        out: list[str] = []
+        for t in _split_flags(extra):
+            # Skip specialized flags we'll rebuild from UI
+            if t.startswith(_COMBO_FLAGS):
+                continue
+            # Ensure other flags remain single shell tokens even if shlex stripped quotes.
+            out.append(_normalize_other_flag_token(t))
+        return out
+
+    def _rebuild_extra_and_write(
+        self,
+        *,
+        kbd: Path | None,
+        palette: Path | None,
+        other_flags: list[str],
+        rebuild_list: bool = True,
+    ) -> None:
         tokens: list[str] = []
         tokens.extend(other_flags)
 
         if kbd is not None:
-            tokens.append(
-                f"--kbdhackfile={_local_to_device_path(root=self._root, local_path=kbd, media_prefix=self._media_prefix)}"
-            )
+            tokens.append(_KBD_FLAG + self._local_to_dev(kbd))
         if palette is not None:
-            tokens.append(
-                f"--gfx-palette={_local_to_device_path(root=self._root, local_path=palette, media_prefix=self._media_prefix)}"
-            )
+            tokens.append(_PAL_FLAG + self._local_to_dev(palette))
 
-        extra = " ".join(t for t in tokens if str(t).strip() != "").strip()
+        tokens = [t for t in tokens if str(t).strip() != ""]
+        extra = " ".join(tokens).strip()
 
         if not isinstance(self._data, dict):
             self._data = {}
@@ -508,24 +695,22 @@ class AdvancedJsonDialog(QDialog):
             self._data["jzintv_extra"] = extra
 
         self._write()
-        self._sync_from_json()
+        split = _split_joined_tokens(tokens)
+        self._sync_from_json(
+            rebuild_list=rebuild_list,
+            known_split=(extra, split) if split is not None else None,
+        )
 
     def _kbd_changed(self) -> None:
         idx = self._cmb_kbd.currentIndex()
         if idx < 0:
             return
-        chosen = self._cmb_kbd.itemData(idx)
         # blank (0): do not change
         if idx == 0:
             return
         # Default (1): remove
-        kbd_path = None
-        if isinstance(chosen, Path):
-            kbd_path = chosen
-
-        pal_path = self._selected_path_or_none(self._cmb_palette)
-        other = self._other_flags_from_ui()
-        self._rebuild_extra_and_write(kbd=kbd_path, palette=pal_path, other_flags=other)
+        self._combo_write_pending = True
+        self._combo_write_timer.start()
 
     def _palette_changed(self) -> None:
         idx = self._cmb_palette.currentIndex()
@@ -533,13 +718,17 @@ class AdvancedJsonDialog(QDialog):
             return
         if idx == 0:
             return
+        self._combo_write_pending = True
+        self._combo_write_timer.start()
 
-        pal_path = None
-        chosen = self._cmb_palette.itemData(idx)
-        if isinstance(chosen, Path):
-            pal_path = chosen
-
+    def _flush_pending(self) -> None:
+        """Write a combo change that is still waiting for its debounce timer."""
+        if not self._combo_write_pending:
+            return
+        self._combo_write_pending = False
+        self._combo_write_timer.stop()
         kbd_path = self._selected_path_or_none(self._cmb_kbd)
+        pal_path = self._selected_path_or_none(self._cmb_palette)
         other = self._other_flags_from_ui()
         self._rebuild_extra_and_write(kbd=kbd_path, palette=pal_path, other_flags=other)
 
@@ -570,7 +759,7 @@ class AdvancedJsonDialog(QDialog):
             return
         # If the user's entry already parses as a single shell token (e.g.
         # --cheat='force 0x00B5 0x00'), accept it as-is.
-        if any(ch.isspace() for ch in flag) and not _is_single_shell_token(flag):
+        if _has_ws(flag) and not _is_single_shell_token(flag):
             flag = shlex.quote(flag)
 
         self._list_flags.addItem(QListWidgetItem(flag))
@@ -578,7 +767,12 @@ class AdvancedJsonDialog(QDialog):
 
         kbd = self._selected_path_or_none(self._cmb_kbd)
         pal = self._selected_path_or_none(self._cmb_palette)
-        self._rebuild_extra_and_write(kbd=kbd, palette=pal, other_flags=self._other_flags_from_ui())
+        self._rebuild_extra_and_write(
+            kbd=kbd,
+            palette=pal,
+            other_flags=self._other_flags_from_ui(),
+            rebuild_list=not _is_listed_form(flag),
+        )
 
     def _edit_flag(self) -> None:
         row = self._list_flags.currentRow()
@@ -592,7 +786,7 @@ class AdvancedJsonDialog(QDialog):
         new = (text or "").strip()
         if new == "":
             return
-        if any(ch.isspace() for ch in new) and not _is_single_shell_token(new):
+        if _has_ws(new) and not _is_single_shell_token(new):
             new = shlex.quote(new)
 
         it.setText(new)
@@ -600,7 +794,12 @@ class AdvancedJsonDialog(QDialog):
 
         kbd = self._selected_path_or_none(self._cmb_kbd)
         pal = self._selected_path_or_none(self._cmb_palette)
-        self._rebuild_extra_and_write(kbd=kbd, palette=pal, other_flags=self._other_flags_from_ui())
+        self._rebuild_extra_and_write(
+            kbd=kbd,
+            palette=pal,
+            other_flags=self._other_flags_from_ui(),
+            rebuild_list=not _is_listed_form(new),
+        )
 
     def _remove_flag(self) -> None:
         row = self._list_flags.currentRow()
@@ -622,4 +821,7 @@ class AdvancedJsonDialog(QDialog):
 
         kbd = self._selected_path_or_none(self._cmb_kbd)
         pal = self._selected_path_or_none(self._cmb_palette)
-        self._rebuild_extra_and_write(kbd=kbd, palette=pal, other_flags=self._other_flags_from_ui())
+        # The remaining items are unchanged, so the list is already correct.
+        self._rebuild_extra_and_write(
+            kbd=kbd, palette=pal, other_flags=self._other_flags_from_ui(), rebuild_list=False
+        )
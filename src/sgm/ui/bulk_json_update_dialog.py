@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
+import os
 import re
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QTimer, QRect, QEvent
@@ -37,39 +39,94 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
+from sgm.io_utils import json_dumps, json_loads
 
 _LANGS = ["en", "fr", "es", "de", "it"]
 
 _NOT_DEFINED = "<Not Defined>"
 _MISSING_FILE = "<Missing File>"
 
+# Row colours by action. Grey = No Change, Green = Adding, Orange = Updating
+# (any other action).
+_NO_CHANGE_BRUSH = QBrush(QColor(222, 222, 222))
+_ADD_BRUSH = QBrush(QColor(198, 240, 198))
+_UPDATE_BRUSH = QBrush(QColor(245, 218, 176))
+_ACTION_BRUSHES: dict[str, QBrush] = {
+    "No Change": _NO_CHANGE_BRUSH,
+    "Missing File": _NO_CHANGE_BRUSH,
+    "Skipped": _NO_CHANGE_BRUSH,
+    "Set Value": _ADD_BRUSH,
+}
+_ROW_TEXT_BRUSH = QBrush(QColor(0, 0, 0))
+
 _MAX_PREVIEW_CHARS = 50
 
+# Preview reads and Apply rewrites one JSON file per game; that is I/O-bound
+# (USB drives, network shares), so the files are handled concurrently.
+_IO_WORKERS = 16
+
+# Apply lists at most this many failed files in its warning.
+_MAX_REPORTED_FAILURES = 10
+
+# Filter text is applied after this quiet period, so typing a filter doesn't
+# re-scan every table row on each keystroke.
+_FILTER_DELAY_MS = 150
+
+# New Value spin boxes / check boxes exist only for rows in (or this many rows
+# around) the viewport; the rest of the column is plain items.
+_VALUE_WIDGET_MARGIN = 5
+
+# Column auto-sizing measures this many rows (Qt's default is 1000); the widths
+# are capped at ~40 characters anyway, so a sample is as good as every row.
+_RESIZE_SAMPLE_ROWS = 200
+
+# Upper bound on cached elided strings per value delegate.
+_ELIDE_CACHE_MAX = 4096
+
 
 class _SortItem(QTableWidgetItem):
     def __init__(self, display_text: str = "", *, sort_key: object | None = None):
         super().__init__(display_text)
-        self._sort_key = display_text if sort_key is None else sort_key
+        self.set_sort_key(display_text if sort_key is None else sort_key)
 
     def set_sort_key(self, sort_key: object) -> None:
+        # Classify once here; __lt__ runs O(N log N) times per sort.
         self._sort_key = sort_key
+        self._sort_str = str(sort_key)
+        try:
+            self._sort_num: float | None = float(sort_key)  # type: ignore[arg-type]
+        except Exception:
+            self._sort_num = None
 
     def __lt__(self, other: QTableWidgetItem) -> bool:  # type: ignore[override]
         if isinstance(other, _SortItem):
-            a = self._sort_key
-            b = other._sort_key
-            try:
-                return float(a) < float(b)
-            except Exception:
-                return str(a) < str(b)
+            a = self._sort_num
+            b = other._sort_num
+            if a is not None and b is not None:
+                return a < b
+            return self._sort_str < other._sort_str
         return super().__lt__(other)
 
 
+def _set_include_state(it: QTableWidgetItem, *, enabled: bool, checked: bool) -> None:
+    # The Include column is a checkable item; a disabled item greys its indicator.
+    # Its sort key is left as built so toggling doesn't move rows under the cursor.
+    flags = it.flags() | Qt.ItemFlag.ItemIsUserCheckable
+    it.setFlags((flags | Qt.ItemFlag.ItemIsEnabled) if enabled else (flags & ~Qt.ItemFlag.ItemIsEnabled))
+    it.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
+
+
 class _ValueButtonDelegate(QStyledItemDelegate):
     def __init__(self, *, table: QTableWidget, on_button_clicked):
         super().__init__(table)
         self._table = table
         self._on_button_clicked = on_button_clicked
+        # (font key, text, width) -> elided text. Every repaint (scrolling, hover,
+        # selection) would otherwise re-shape the same strings at the same width.
+        self._elide_cache: dict[tuple[str, str, int], str] = {}
+        # Font metrics for the last font seen; shared by every cache miss.
+        self._fm_key: str | None = None
+        self._fm: QFontMetrics | None = None
 
     def _button_rect(self, option) -> "QRect":
         r = option.rect
@@ -99,8 +156,18 @@ class _ValueButtonDelegate(QStyledItemDelegate):
             pal = opt.palette
             role = QPalette.ColorRole.HighlightedText if (opt.state & QStyle.StateFlag.State_Selected) else QPalette.ColorRole.Text
             painter.setPen(pal.color(role))
-            fm = painter.fontMetrics()
-            elided = fm.elidedText(full_text, Qt.TextElideMode.ElideRight, max(10, text_r.width()))
+            width = max(10, text_r.width())
+            font_key = painter.font().key()
+            key = (font_key, full_text, width)
+            elided = self._elide_cache.get(key)
+            if elided is None:
+                if len(self._elide_cache) >= _ELIDE_CACHE_MAX:
+                    self._elide_cache.clear()
+                if self._fm is None or font_key != self._fm_key:
+                    self._fm_key = font_key
+                    self._fm = painter.fontMetrics()
+                elided = self._fm.elidedText(full_text, Qt.TextElideMode.ElideRight, width)
+                self._elide_cache[key] = elided
             painter.drawText(text_r, int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft), elided)
         finally:
             painter.restore()
@@ -156,6 +223,8 @@ class _ValueButtonDelegate(QStyledItemDelegate):
 
 
 def _elide_text(s: str, *, max_chars: int = _MAX_PREVIEW_CHARS) -> str:
+    if isinstance(s, str) and len(s) <= max_chars:
+        return s
     s = str(s or "")
     if len(s) <= max_chars:
         return s
@@ -213,11 +282,25 @@ class _TextPopupDialog(QDialog):
         return self._edit.toPlainText()
 
 
-@dataclass
+def _split_key_path(key_path: str) -> tuple[str, ...]:
+    return tuple(p for p in str(key_path or "").split("/") if p.strip() != "")
+
+
+# dataclass(slots=True) needs Python 3.10; older Pythons (mac may run 3.9)
+# keep regular __dict__-backed instances.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class _FieldSpec:
     label: str
     key_path: str
     field_type: str  # "text" | "number" | "bool" | "other"
+    parts: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Standard key paths are fixed, so split them once here.
+        object.__setattr__(self, "parts", _split_key_path(self.key_path))
 
 
 _STANDARD_FIELDS: list[_FieldSpec] = [
@@ -235,7 +318,7 @@ _STANDARD_FIELDS: list[_FieldSpec] = [
 ]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class _Row:
     game_id: str
     basename: str
@@ -262,22 +345,61 @@ class _Row:
 
 def _load_json_dict(path: Path) -> dict:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json_loads(path.read_bytes())
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
 
 
-def _write_json_dict(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+def _encode_json(data: dict) -> bytes:
+    buf = json_dumps(data) + b"\n"
+    if os.linesep != "\n":
+        # Match write_text's platform line endings. Newlines inside strings are
+        # escaped, so every raw newline here is layout.
+        buf = buf.replace(b"\n", os.linesep.encode("ascii"))
+    return buf
+
+
+def _write_bytes_atomic(path: Path, buf: bytes) -> None:
+    # Write to a sibling temp file and swap it in, so an interrupted write
+    # never leaves a truncated JSON file behind.
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(buf)
+        tmp.replace(path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+        raise
 
 
-def _split_key_path(key_path: str) -> list[str]:
-    parts = [p for p in str(key_path or "").split("/") if p.strip() != ""]
-    return [str(p) for p in parts]
+def _write_json_dict(path: Path, data: dict) -> None:
+    _write_bytes_atomic(path, _encode_json(data))
 
 
-def _get_at_path(data: dict, parts: list[str]) -> tuple[bool, object]:
+def _list_file_names(folder: Path) -> set[str]:
+    # One directory read answers "does <game>.json exist?" for every game in the folder.
+    try:
+        with os.scandir(folder) as it:
+            return {e.name for e in it if e.is_file()}
+    except OSError:
+        return set()
+
+
+def _get_at_path(data: dict, parts: tuple[str, ...]) -> tuple[bool, object]:
+    # Every standard field is one or two levels deep (e.g. "year", "description/en");
+    # those are looked up directly, deeper paths are walked.
+    n = len(parts)
+    if n == 1:
+        p0 = parts[0]
+        return (True, data[p0]) if p0 in data else (False, None)
+    if n == 2:
+        sub = data.get(parts[0])
+        if isinstance(sub, dict) and parts[1] in sub:
+            return (True, sub[parts[1]])
+        return (False, None)
     if not parts:
         return (False, None)
     cur: object = data
@@ -292,7 +414,7 @@ def _get_at_path(data: dict, parts: list[str]) -> tuple[bool, object]:
     return (False, None)
 
 
-def _ensure_dict_path(data: dict, parts: list[str]) -> dict:
+def _ensure_dict_path(data: dict, parts: tuple[str, ...]) -> dict:
     cur: dict = data
     for p in parts:
         nxt = cur.get(p)
@@ -303,7 +425,7 @@ def _ensure_dict_path(data: dict, parts: list[str]) -> dict:
     return cur
 
 
-def _set_at_path(data: dict, parts: list[str], value: object) -> None:
+def _set_at_path(data: dict, parts: tuple[str, ...], value: object) -> None:
     if not parts:
         return
     if len(parts) == 1:
@@ -313,7 +435,7 @@ def _set_at_path(data: dict, parts: list[str], value: object) -> None:
     parent[parts[-1]] = value
 
 
-def _del_at_path(data: dict, parts: list[str]) -> bool:
+def _del_at_path(data: dict, parts: tuple[str, ...]) -> bool:
     if not parts:
         return False
     if len(parts) == 1:
@@ -381,9 +503,25 @@ class BulkJsonUpdateDialog(QDialog):
 
         self._field_spec: _FieldSpec = _STANDARD_FIELDS[0]
         self._key_path: str = ""
+        self._key_parts: tuple[str, ...] = ()
         self._field_type: str = "text"  # text|number|bool
         self._update_option: str = "no_change"
         self._rows: list[_Row] = []
+        # game_id -> index into self._rows, and -> that row's Include item (whose
+        # row() tracks the view row through sorting).
+        self._model_idx_by_gid: dict[str, int] = {}
+        self._include_item_by_gid: dict[str, QTableWidgetItem] = {}
+        # Included visible rows, i.e. what the "Will update" label shows.
+        self._will_update = 0
+        # New Value editor widgets: the field type the table was built for
+        # ("number"/"bool", else None) and the game ids that currently have one.
+        self._value_widget_kind: str | None = None
+        self._value_widget_gids: set[str] = set()
+        # Parsed JSON per file, keyed by (mtime_ns, size) so repeated previews skip unchanged files.
+        self._json_cache: dict[Path, tuple[int, int, dict]] = {}
+        # Regex option: the pattern last compiled, and the result (None if invalid).
+        self._regex_pattern: str | None = None
+        self._regex_compiled: re.Pattern | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -691,6 +829,11 @@ class BulkJsonUpdateDialog(QDialog):
         self._btn_filter_toggle.clicked.connect(self._toggle_filter_visibility)
         filter_root_l.addWidget(self._btn_filter_toggle)
 
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filters)
+
         self._filter_content = QGroupBox()
         self._filter_content.setFlat(True)
         form_filter = QFormLayout(self._filter_content)
@@ -716,7 +859,7 @@ class BulkJsonUpdateDialog(QDialog):
             self._cmb_filter_game_op.setCurrentIndex(idx_contains)
         self._txt_filter_game = QLineEdit()
         self._txt_filter_game.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self._txt_filter_game.textChanged.connect(self._apply_filters)
+        self._txt_filter_game.textChanged.connect(self._schedule_apply_filters)
         self._cmb_filter_game_op.currentIndexChanged.connect(self._apply_filters)
         w_game_filter = QWidget()
         w_game_filter_l = QHBoxLayout(w_game_filter)
@@ -754,7 +897,7 @@ class BulkJsonUpdateDialog(QDialog):
             self._cmb_filter_cur_op.setCurrentIndex(idx_contains)
         self._txt_filter_cur = QLineEdit()
         self._txt_filter_cur.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self._txt_filter_cur.textChanged.connect(self._apply_filters)
+        self._txt_filter_cur.textChanged.connect(self._schedule_apply_filters)
         self._cmb_filter_cur_op.currentIndexChanged.connect(self._apply_filters)
         w_cur_filter = QWidget()
         w_cur_filter_l = QHBoxLayout(w_cur_filter)
@@ -771,6 +914,7 @@ class BulkJsonUpdateDialog(QDialog):
         self._tbl = QTableWidget(0, 5)
         self._tbl.setHorizontalHeaderLabels(["Include", "Game", "Current Value", "New Value", "Action"])
         self._tbl.verticalHeader().setVisible(False)
+        self._tbl.horizontalHeader().setResizeContentsPrecision(_RESIZE_SAMPLE_ROWS)
         self._tbl.setAlternatingRowColors(True)
         self._tbl.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self._tbl.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
@@ -791,6 +935,16 @@ class BulkJsonUpdateDialog(QDialog):
         # Replace single-click popups with a small in-cell button.
         self._tbl.setItemDelegateForColumn(2, _ValueButtonDelegate(table=self._tbl, on_button_clicked=self._value_button_clicked))
         self._tbl.setItemDelegateForColumn(3, _ValueButtonDelegate(table=self._tbl, on_button_clicked=self._value_button_clicked))
+
+        # Scrolling moves the visible rows directly; resizes and re-sorts are
+        # handled once control returns to the event loop.
+        self._value_widget_timer = QTimer(self)
+        self._value_widget_timer.setSingleShot(True)
+        self._value_widget_timer.setInterval(0)
+        self._value_widget_timer.timeout.connect(self._sync_value_widgets)
+        self._tbl.verticalScrollBar().valueChanged.connect(self._sync_value_widgets)
+        self._tbl.verticalScrollBar().rangeChanged.connect(self._value_widget_timer.start)
+        self._tbl.model().layoutChanged.connect(self._value_widget_timer.start)
         layout.addWidget(self._tbl, 1)
 
         bottom = QHBoxLayout()
@@ -822,6 +976,21 @@ class BulkJsonUpdateDialog(QDialog):
     def _game_text(self, row: _Row) -> str:
         return f"{row.basename}  —  {row.folder}"
 
+    def _load_json_cached(self, path: Path) -> dict:
+        # Like _load_json_dict, but reuses the last parse while the file is unchanged.
+        # The returned dict is shared with the cache; callers must not mutate it.
+        try:
+            st = path.stat()
+        except OSError:
+            self._json_cache.pop(path, None)
+            return {}
+        hit = self._json_cache.get(path)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        data = _load_json_dict(path)
+        self._json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
     def _game_id_for_view_row(self, view_row: int) -> str | None:
         if view_row < 0 or view_row >= self._tbl.rowCount():
             return None
@@ -832,61 +1001,73 @@ class BulkJsonUpdateDialog(QDialog):
         return None if v is None else str(v)
 
     def _model_row_index_for_game_id(self, game_id: str) -> int | None:
-        for i, row in enumerate(self._rows or []):
-            if row.game_id == game_id:
-                return i
-        return None
+        return self._model_idx_by_gid.get(game_id)
 
     def _view_row_for_game_id(self, game_id: str) -> int | None:
-        for r in range(self._tbl.rowCount()):
-            if self._game_id_for_view_row(r) == game_id:
-                return r
-        return None
+        it = self._include_item_by_gid.get(game_id)
+        if it is None:
+            return None
+        r = it.row()
+        return r if r >= 0 else None
+
+    def _include_checked_at(self, view_row: int) -> bool:
+        it = self._tbl.item(view_row, 0)
+        if it is None or not (it.flags() & Qt.ItemFlag.ItemIsEnabled):
+            return False
+        return it.checkState() == Qt.CheckState.Checked
 
     def _update_apply_enabled(self) -> None:
-        enabled = False
         will_update = 0
         visible_rows = 0
         for view_row in range(self._tbl.rowCount()):
             if self._tbl.isRowHidden(view_row):
                 continue
             visible_rows += 1
-            w = self._tbl.cellWidget(view_row, 0)
-            if isinstance(w, QCheckBox) and w.isEnabled() and w.isChecked():
-                enabled = True
+            if self._include_checked_at(view_row):
                 will_update += 1
-        self._btn_apply.setEnabled(bool(enabled))
+        self._will_update = will_update
+        self._show_apply_count()
         try:
-            self._lbl_apply_count.setText(f"Will update: {int(will_update)}")
             self._lbl_row_count.setText(f"Rows: {int(visible_rows)}")
         except Exception:
             pass
 
-    def _apply_row_background(self, view_row: int, action: str) -> None:
-        # Grey = No Change, Green = Adding, Orange = Updating
-        grey = QBrush(QColor(222, 222, 222))
-        green = QBrush(QColor(198, 240, 198))
-        orange = QBrush(QColor(245, 218, 176))
-        black = QBrush(QColor(0, 0, 0))
-
-        if action in {"No Change", "Missing File", "Skipped"}:
-            brush = grey
-        elif action in {"Set Value"}:
-            brush = green
-        else:
-            brush = orange
+    def _row_include_changed(self, game_id: str, was_included: bool) -> None:
+        # One row's Include state changed: adjust the count instead of
+        # re-walking the whole table. Looked up by game id, since updating the
+        # row may have re-sorted it.
+        view_row = self._view_row_for_game_id(game_id)
+        if view_row is None or self._tbl.isRowHidden(view_row):
+            return
+        included = self._include_checked_at(view_row)
+        if included == was_included:
+            return
+        self._will_update += 1 if included else -1
+        self._show_apply_count()
 
+    def _show_apply_count(self) -> None:
+        self._btn_apply.setEnabled(self._will_update > 0)
+        try:
+            self._lbl_apply_count.setText(f"Will update: {int(self._will_update)}")
+        except Exception:
+            pass
+
+    def _apply_row_background(self, view_row: int, action: str) -> None:
+        brush = _ACTION_BRUSHES.get(action, _UPDATE_BRUSH)
         for col in range(self._tbl.columnCount()):
             it = self._tbl.item(view_row, col)
             if it is not None:
                 it.setBackground(brush)
-                it.setForeground(black)
+                it.setForeground(_ROW_TEXT_BRUSH)
 
     def _bulk_set_include(self, checked: bool) -> None:
         if not self._rows:
             return
+        self._flush_pending_filters()
 
         self._tbl.setSortingEnabled(False)
+        self._tbl.setUpdatesEnabled(False)
+        self._tbl.blockSignals(True)
         try:
             for view_row in range(self._tbl.rowCount()):
                 if self._tbl.isRowHidden(view_row):
@@ -904,13 +1085,9 @@ class BulkJsonUpdateDialog(QDialog):
                 row.include_checked = bool(checked)
                 row.action = row.base_action if row.include_checked else "Skipped"
 
-                w_inc = self._tbl.cellWidget(view_row, 0)
-                if isinstance(w_inc, QCheckBox):
-                    w_inc.blockSignals(True)
-                    try:
-                        w_inc.setChecked(bool(row.include_checked))
-                    finally:
-                        w_inc.blockSignals(False)
+                it_inc = self._tbl.item(view_row, 0)
+                if it_inc is not None:
+                    _set_include_state(it_inc, enabled=True, checked=row.include_checked)
 
                 it_act = self._tbl.item(view_row, 4)
                 if it_act is not None:
@@ -920,6 +1097,8 @@ class BulkJsonUpdateDialog(QDialog):
 
                 self._apply_row_background(view_row, row.action)
         finally:
+            self._tbl.blockSignals(False)
+            self._tbl.setUpdatesEnabled(True)
             self._tbl.setSortingEnabled(True)
 
         self._update_apply_enabled()
@@ -950,6 +1129,12 @@ class BulkJsonUpdateDialog(QDialog):
 
     def _inputs_changed(self, *args) -> None:
         self._key_path = (self._cmb_key.currentText() or "").strip()
+        # Split once per key change; standard fields carry theirs pre-split.
+        spec = self._field_spec
+        if spec.field_type != "other" and spec.key_path == self._key_path:
+            self._key_parts = spec.parts
+        else:
+            self._key_parts = _split_key_path(self._key_path)
         self._field_type = str(self._cmb_type.currentData() or "text")
         self._update_option = str(self._cmb_update.currentData() or "no_change")
 
@@ -1059,14 +1244,26 @@ class BulkJsonUpdateDialog(QDialog):
                 return a.strip()
             return cur_s + a
         if self._update_option == "regex":
-            pattern = str(self._txt_regex.text() or "")
+            rx = self._compiled_regex(str(self._txt_regex.text() or ""))
             repl = str(self._txt_regex_repl.text() or "")
+            if rx is None:
+                return repl
             try:
-                return re.sub(pattern, repl, cur_s)
+                return rx.sub(repl, cur_s)
             except Exception:
                 return repl
         return cur_s
 
+    def _compiled_regex(self, pattern: str) -> re.Pattern | None:
+        # Compiled once per pattern rather than looked up in re's cache for every row.
+        if pattern != self._regex_pattern:
+            self._regex_pattern = pattern
+            try:
+                self._regex_compiled = re.compile(pattern)
+            except Exception:
+                self._regex_compiled = None
+        return self._regex_compiled
+
     def _proposed_new_display(self, *, cur_raw: object, key_present: bool) -> str:
         if self._field_type == "number":
             if self._update_option == "remove":
@@ -1184,15 +1381,30 @@ class BulkJsonUpdateDialog(QDialog):
 
     def _preview_clicked(self) -> None:
         try:
-            parts = _split_key_path(self._key_path)
+            parts = self._key_parts
             if not parts:
                 return
 
+            games = self._all_games or []
+            json_paths = [Path(folder) / f"{basename}.json" for _gid, folder, basename in games]
+
+            names_by_folder: dict[Path, set[str]] = {}
+
+            def _load(json_path: Path) -> tuple[bool, dict]:
+                # Names the listing doesn't match exactly (e.g. different case on a
+                # case-insensitive file system) still get a stat.
+                has_file = json_path.name in names_by_folder[json_path.parent] or json_path.exists()
+                return (has_file, self._load_json_cached(json_path) if has_file else {})
+
+            loaded: list[tuple[bool, dict]] = []
+            if json_paths:
+                folders = list(dict.fromkeys(p.parent for p in json_paths))
+                with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(json_paths))) as pool:
+                    names_by_folder.update(zip(folders, pool.map(_list_file_names, folders)))
+                    loaded = list(pool.map(_load, json_paths))
+
             rows: list[_Row] = []
-            for game_id, folder, basename in (self._all_games or []):
-                json_path = Path(folder) / f"{basename}.json"
-                has_file = bool(json_path.exists())
-                data = _load_json_dict(json_path) if has_file else {}
+            for (game_id, folder, basename), json_path, (has_file, data) in zip(games, json_paths, loaded):
                 had_key, cur_raw = _get_at_path(data, parts) if has_file else (False, None)
 
                 if not has_file:
@@ -1216,6 +1428,7 @@ class BulkJsonUpdateDialog(QDialog):
                 rows.append(row)
 
             self._rows = rows
+            self._model_idx_by_gid = {row.game_id: i for i, row in enumerate(rows)}
             self._rebuild_table()
             self._btn_check_all.setEnabled(True)
             self._btn_uncheck_all.setEnabled(True)
@@ -1229,99 +1442,30 @@ class BulkJsonUpdateDialog(QDialog):
     def _rebuild_table(self) -> None:
         was_sorting = self._tbl.isSortingEnabled()
         self._tbl.setSortingEnabled(False)
+        self._tbl.setUpdatesEnabled(False)
         self._tbl.blockSignals(True)
         try:
+            n = len(self._rows)
             for rr in range(self._tbl.rowCount()):
                 for cc in range(self._tbl.columnCount()):
-                    if self._tbl.cellWidget(rr, cc) is not None:
-                        self._tbl.removeCellWidget(rr, cc)
-
-            self._tbl.clearContents()
-            self._tbl.setRowCount(0)
-            self._tbl.setRowCount(len(self._rows))
+                    w = self._tbl.cellWidget(rr, cc)
+                    if w is None:
+                        continue
+                    # A Create JSON link stays if this row still lacks a file;
+                    # _fill_table_row points it at the new game.
+                    if cc == 2 and isinstance(w, QLabel) and rr < n and not self._rows[rr].has_file:
+                        continue
+                    self._tbl.removeCellWidget(rr, cc)
+
+            self._include_item_by_gid.clear()
+            self._value_widget_gids.clear()
+            self._value_widget_kind = self._field_type if self._field_type in ("number", "bool") else None
+            # Every cell of every row is replaced below, so existing rows are
+            # kept rather than cleared and re-inserted.
+            self._tbl.setRowCount(n)
 
             for r, row in enumerate(self._rows):
-                # Include
-                include_chk = QCheckBox()
-                include_chk.setChecked(bool(row.include_checked))
-                include_chk.setEnabled(bool(row.include_enabled))
-                include_chk.toggled.connect(lambda checked, gid=row.game_id: self._include_toggled(gid, checked))
-                self._tbl.setCellWidget(r, 0, include_chk)
-
-                it_inc = _SortItem("", sort_key=1 if row.include_checked else 0)
-                it_inc.setData(Qt.ItemDataRole.UserRole, row.game_id)
-                it_inc.setFlags(it_inc.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self._tbl.setItem(r, 0, it_inc)
-
-                # Game
-                game_text = self._game_text(row)
-                it_game = _SortItem(game_text, sort_key=game_text.casefold())
-                it_game.setToolTip(game_text)
-                it_game.setFlags(it_game.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self._tbl.setItem(r, 1, it_game)
-
-                # Current Value
-                if not row.has_file:
-                    link = QLabel('<a style="text-decoration: underline; color: #1a73e8;" href="create">Create JSON</a>')
-                    link.setTextFormat(Qt.TextFormat.RichText)
-                    link.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-                    link.setOpenExternalLinks(False)
-                    link.linkActivated.connect(lambda _href, gid=row.game_id: self._create_json_clicked(gid))
-                    self._tbl.setCellWidget(r, 2, link)
-                    it_cur = _SortItem("", sort_key=_MISSING_FILE)
-                    it_cur.setFlags(it_cur.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 2, it_cur)
-                else:
-                    cur_text = str(row.current_value_display or "")
-                    it_cur = _SortItem(cur_text, sort_key=cur_text.casefold())
-                    it_cur.setToolTip(cur_text)
-                    it_cur.setFlags(it_cur.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 2, it_cur)
-
-                # New Value
-                if not row.has_file:
-                    it_new = _SortItem("", sort_key="")
-                    it_new.setFlags(it_new.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 3, it_new)
-                elif self._field_type == "number":
-                    sb = QSpinBox()
-                    if self._key_path == "year":
-                        sb.setRange(0, 9999)
-                    else:
-                        sb.setRange(-2147483648, 2147483647)
-                    try:
-                        sb.setValue(int(str(row.new_value_display).strip() or "0"))
-                    except Exception:
-                        sb.setValue(0)
-                    sb.valueChanged.connect(lambda _v, gid=row.game_id: self._new_value_widget_changed(gid))
-                    self._tbl.setCellWidget(r, 3, sb)
-                    it_ph = _SortItem("", sort_key=str(row.new_value_display))
-                    it_ph.setFlags(it_ph.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 3, it_ph)
-                elif self._field_type == "bool":
-                    cb = QCheckBox()
-                    cb.setChecked(str(row.new_value_display).strip().lower() in {"1", "true", "yes", "on"})
-                    cb.toggled.connect(lambda _v, gid=row.game_id: self._new_value_widget_changed(gid))
-                    self._tbl.setCellWidget(r, 3, cb)
-                    it_ph = _SortItem("", sort_key=str(row.new_value_display))
-                    it_ph.setFlags(it_ph.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 3, it_ph)
-                else:
-                    new_text = str(row.new_value_display or "")
-                    it_new = _SortItem(new_text, sort_key=new_text.casefold())
-                    it_new.setToolTip(new_text)
-                    if row.new_value_editable:
-                        it_new.setFlags(it_new.flags() | Qt.ItemFlag.ItemIsEditable)
-                    else:
-                        it_new.setFlags(it_new.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self._tbl.setItem(r, 3, it_new)
-
-                # Action
-                it_act = _SortItem(row.action, sort_key=row.action)
-                it_act.setFlags(it_act.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self._tbl.setItem(r, 4, it_act)
-
-                self._apply_row_background(r, row.action)
+                self._fill_table_row(r, row)
 
             self._tbl.resizeColumnsToContents()
 
@@ -1341,7 +1485,118 @@ class BulkJsonUpdateDialog(QDialog):
             _cap(4, min_px=140)
         finally:
             self._tbl.blockSignals(False)
+            self._tbl.setUpdatesEnabled(True)
+            # Re-enabling sorting sorts once by the current header indicator.
             self._tbl.setSortingEnabled(bool(was_sorting))
+        self._sync_value_widgets()
+
+    def _fill_table_row(self, r: int, row: _Row) -> None:
+        # Include (toggles arrive through itemChanged)
+        it_inc = _SortItem("", sort_key=1 if row.include_checked else 0)
+        it_inc.setData(Qt.ItemDataRole.UserRole, row.game_id)
+        it_inc.setFlags(it_inc.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        _set_include_state(it_inc, enabled=row.include_enabled, checked=row.include_checked)
+        self._include_item_by_gid[row.game_id] = it_inc
+
+        # Game
+        game_text = self._game_text(row)
+        it_game = _SortItem(game_text, sort_key=game_text.casefold())
+        it_game.setToolTip(game_text)
+        it_game.setFlags(it_game.flags() & ~Qt.ItemFlag.ItemIsEditable)
+
+        # Current Value
+        if not row.has_file:
+            link = self._tbl.cellWidget(r, 2)
+            if not isinstance(link, QLabel):
+                link = QLabel('<a style="text-decoration: underline; color: #1a73e8;" href="create">Create JSON</a>')
+                link.setTextFormat(Qt.TextFormat.RichText)
+                link.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+                link.setOpenExternalLinks(False)
+                link.linkActivated.connect(lambda _href, w=link: self._create_json_clicked(str(w.property("game_id"))))
+                self._tbl.setCellWidget(r, 2, link)
+            link.setProperty("game_id", row.game_id)
+            it_cur = _SortItem("", sort_key=_MISSING_FILE)
+            it_cur.setFlags(it_cur.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        else:
+            cur_text = str(row.current_value_display or "")
+            it_cur = _SortItem(cur_text, sort_key=cur_text.casefold())
+            it_cur.setToolTip(cur_text)
+            it_cur.setFlags(it_cur.flags() & ~Qt.ItemFlag.ItemIsEditable)
+
+        # New Value
+        if not row.has_file:
+            it_new = _SortItem("", sort_key="")
+            it_new.setFlags(it_new.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        elif self._field_type in ("number", "bool"):
+            # The editor widget is installed by _sync_value_widgets once the row is on screen.
+            it_new = _SortItem("", sort_key=str(row.new_value_display))
+            it_new.setFlags(it_new.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        else:
+            new_text = str(row.new_value_display or "")
+            it_new = _SortItem(new_text, sort_key=new_text.casefold())
+            it_new.setToolTip(new_text)
+            if row.new_value_editable:
+                it_new.setFlags(it_new.flags() | Qt.ItemFlag.ItemIsEditable)
+            else:
+                it_new.setFlags(it_new.flags() & ~Qt.ItemFlag.ItemIsEditable)
+
+        # Action
+        it_act = _SortItem(row.action, sort_key=row.action)
+        it_act.setFlags(it_act.flags() & ~Qt.ItemFlag.ItemIsEditable)
+
+        # Colour the items before they go into the table, so styling doesn't
+        # emit a change notification per cell.
+        brush = _ACTION_BRUSHES.get(row.action, _UPDATE_BRUSH)
+        for col, it in enumerate((it_inc, it_game, it_cur, it_new, it_act)):
+            it.setBackground(brush)
+            it.setForeground(_ROW_TEXT_BRUSH)
+            self._tbl.setItem(r, col, it)
+
+    def _make_value_widget(self, row: _Row, kind: str) -> QWidget:
+        if kind == "number":
+            sb = QSpinBox()
+            if self._key_path == "year":
+                sb.setRange(0, 9999)
+            else:
+                sb.setRange(-2147483648, 2147483647)
+            try:
+                sb.setValue(int(str(row.new_value_display).strip() or "0"))
+            except Exception:
+                sb.setValue(0)
+            sb.valueChanged.connect(lambda _v, gid=row.game_id: self._new_value_widget_changed(gid))
+            return sb
+        cb = QCheckBox()
+        cb.setChecked(str(row.new_value_display).strip().lower() in {"1", "true", "yes", "on"})
+        cb.toggled.connect(lambda _v, gid=row.game_id: self._new_value_widget_changed(gid))
+        return cb
+
+    def _sync_value_widgets(self, *args) -> None:
+        # Install New Value editors for rows near the viewport and drop the rest,
+        # so a large preview holds a screenful of widgets rather than one per game.
+        self._value_widget_timer.stop()
+        kind = self._value_widget_kind
+        wanted: set[str] = set()
+        n = self._tbl.rowCount()
+        if kind is not None and n > 0:
+            first = self._tbl.rowAt(0)
+            last = self._tbl.rowAt(self._tbl.viewport().height() - 1)
+            first = 0 if first < 0 else first
+            last = n - 1 if last < 0 else last
+            for r in range(max(0, first - _VALUE_WIDGET_MARGIN), min(n, last + 1 + _VALUE_WIDGET_MARGIN)):
+                if self._tbl.isRowHidden(r):
+                    continue
+                gid = self._game_id_for_view_row(r)
+                model_idx = None if gid is None else self._model_row_index_for_game_id(gid)
+                if model_idx is None or not self._rows[model_idx].has_file:
+                    continue
+                wanted.add(gid)
+                if self._tbl.cellWidget(r, 3) is None:
+                    self._tbl.setCellWidget(r, 3, self._make_value_widget(self._rows[model_idx], kind))
+        for gid in self._value_widget_gids - wanted:
+            r = self._view_row_for_game_id(gid)
+            if r is not None:
+                self._tbl.removeCellWidget(r, 3)
+        self._value_widget_gids = wanted
 
     def _include_toggled(self, game_id: str, checked: bool) -> None:
         model_idx = self._model_row_index_for_game_id(game_id)
@@ -1351,6 +1606,7 @@ class BulkJsonUpdateDialog(QDialog):
         row = self._rows[model_idx]
         if not row.include_enabled:
             return
+        was_included = row.include_checked
         row.include_checked = bool(checked)
         row.action = row.base_action if row.include_checked else "Skipped"
 
@@ -1360,7 +1616,7 @@ class BulkJsonUpdateDialog(QDialog):
             if isinstance(it_act, _SortItem):
                 it_act.set_sort_key(row.action)
         self._apply_row_background(view_row, row.action)
-        self._update_apply_enabled()
+        self._row_include_changed(game_id, was_included)
 
     def _new_value_widget_changed(self, game_id: str) -> None:
         model_idx = self._model_row_index_for_game_id(game_id)
@@ -1423,6 +1679,17 @@ class BulkJsonUpdateDialog(QDialog):
         if it is None:
             return
         col = int(it.column())
+        if col == 0:
+            gid = it.data(Qt.ItemDataRole.UserRole)
+            model_idx = None if gid is None else self._model_row_index_for_game_id(str(gid))
+            if model_idx is None:
+                return
+            checked = it.checkState() == Qt.CheckState.Checked
+            # itemChanged also fires for the row colors; only react to an actual toggle.
+            if checked == self._rows[model_idx].include_checked:
+                return
+            self._include_toggled(str(gid), checked)
+            return
         if col != 3:
             return
         if self._field_type != "text":
@@ -1455,8 +1722,8 @@ class BulkJsonUpdateDialog(QDialog):
         if not row.has_file:
             return
 
-        parts = _split_key_path(self._key_path)
-        data = _load_json_dict(row.json_path)
+        parts = self._key_parts
+        data = self._load_json_cached(row.json_path)
         had_key, cur_raw = _get_at_path(data, parts)
         cur_disp = _display_value(cur_raw, field_type=self._field_type, key_path=self._key_path) if had_key else _NOT_DEFINED
 
@@ -1480,6 +1747,7 @@ class BulkJsonUpdateDialog(QDialog):
         self._rows[model_idx] = updated
 
         # Update UI.
+        was_included = self._include_checked_at(view_row)
         self._tbl.blockSignals(True)
         try:
             it_cur = self._tbl.item(view_row, 2)
@@ -1489,14 +1757,9 @@ class BulkJsonUpdateDialog(QDialog):
                 if isinstance(it_cur, _SortItem):
                     it_cur.set_sort_key(str(cur_disp).casefold())
 
-            w_inc = self._tbl.cellWidget(view_row, 0)
-            if isinstance(w_inc, QCheckBox):
-                w_inc.blockSignals(True)
-                try:
-                    w_inc.setEnabled(bool(updated.include_enabled))
-                    w_inc.setChecked(bool(updated.include_checked))
-                finally:
-                    w_inc.blockSignals(False)
+            it_inc = self._tbl.item(view_row, 0)
+            if it_inc is not None:
+                _set_include_state(it_inc, enabled=updated.include_enabled, checked=updated.include_checked)
 
             it_act = self._tbl.item(view_row, 4)
             if it_act is not None:
@@ -1507,7 +1770,7 @@ class BulkJsonUpdateDialog(QDialog):
             self._tbl.blockSignals(False)
 
         self._apply_row_background(view_row, updated.action)
-        self._update_apply_enabled()
+        self._row_include_changed(game_id, was_included)
 
     # ---------- filters ----------
 
@@ -1526,7 +1789,18 @@ class BulkJsonUpdateDialog(QDialog):
             return nc not in hc
         return True
 
+    def _schedule_apply_filters(self, *args) -> None:
+        self._filter_timer.start()
+
+    def _flush_pending_filters(self) -> None:
+        # Row visibility decides what Check All / Perform Updates touch, so
+        # apply any filter still waiting on the timer first.
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._apply_filters()
+
     def _apply_filters(self) -> None:
+        self._filter_timer.stop()
         if not self._rows:
             return
 
@@ -1568,6 +1842,7 @@ class BulkJsonUpdateDialog(QDialog):
 
             self._tbl.setRowHidden(view_row, not (ok_game and ok_cur))
 
+        self._sync_value_widgets()
         self._update_apply_enabled()
         self._update_filter_header()
 
@@ -1648,11 +1923,13 @@ class BulkJsonUpdateDialog(QDialog):
         except Exception as e:
             QMessageBox.warning(self, "Create JSON", str(e))
             return
+        finally:
+            self._json_cache.pop(row.json_path, None)
 
         # Recompute just this row.
         row.has_file = True
-        parts = _split_key_path(self._key_path)
-        data2 = _load_json_dict(row.json_path)
+        parts = self._key_parts
+        data2 = self._load_json_cached(row.json_path)
         had_key, cur_raw = _get_at_path(data2, parts)
         cur_disp = _display_value(cur_raw, field_type=self._field_type, key_path=self._key_path) if had_key else _NOT_DEFINED
         row.current_value_display = cur_disp
@@ -1672,16 +1949,30 @@ class BulkJsonUpdateDialog(QDialog):
             new_disp=str(row.new_value_display or ""),
         )
         self._rows[model_idx] = updated
-        self._rebuild_table()
+
+        # Refresh just this row; the rest of the table is unaffected.
+        self._tbl.setSortingEnabled(False)
+        self._tbl.blockSignals(True)
+        try:
+            self._tbl.removeCellWidget(view_row, 2)
+            self._fill_table_row(view_row, updated)
+        finally:
+            self._tbl.blockSignals(False)
+            self._tbl.setSortingEnabled(True)
+        self._sync_value_widgets()
         self._apply_filters()
         self._update_apply_enabled()
 
     def _perform_updates(self) -> None:
-        parts = _split_key_path(self._key_path)
+        parts = self._key_parts
         if not parts:
             return
+        self._flush_pending_filters()
 
         # Apply only to rows that are included AND visible.
+        # json path -> (delete, new raw value). Keyed by path so no two workers
+        # ever write the same file; the last row wins, as it would sequentially.
+        jobs: dict[Path, tuple[bool, object]] = {}
         for view_row in range(self._tbl.rowCount()):
             if self._tbl.isRowHidden(view_row):
                 continue
@@ -1695,36 +1986,77 @@ class BulkJsonUpdateDialog(QDialog):
             if not row.has_file:
                 continue
 
-            w_inc = self._tbl.cellWidget(view_row, 0)
-            if not isinstance(w_inc, QCheckBox) or not w_inc.isEnabled() or not w_inc.isChecked():
+            if not self._include_checked_at(view_row):
                 continue
 
-            data = _load_json_dict(row.json_path)
-
+            new_raw: object
             # Treat <Not Defined> as delete.
-            if str(row.new_value_display) == _NOT_DEFINED:
+            delete = str(row.new_value_display) == _NOT_DEFINED
+            if delete:
+                new_raw = None
+            elif self._field_type == "number":
+                try:
+                    new_raw = int(str(row.new_value_display).strip() or "0")
+                except Exception:
+                    new_raw = 0
+            elif self._field_type == "bool":
+                new_raw = str(row.new_value_display).strip().lower() in {"1", "true", "yes", "on"}
+            else:
+                new_raw = str(row.new_value_display)
+                if self._key_path.startswith("description/"):
+                    new_raw = _desc_for_json(str(new_raw))
+            jobs[row.json_path] = (delete, new_raw)
+
+        # Freshly written files go straight into the JSON cache, so the refresh
+        # below doesn't parse them again. Workers only set their own keys.
+        written: dict[Path, tuple[int, int, dict]] = {}
+
+        def _update(json_path: Path) -> Exception | None:
+            delete, new_raw = jobs[json_path]
+            # Read fresh rather than from the cache: the dict is modified below.
+            data = _load_json_dict(json_path)
+            had_key, cur_raw = _get_at_path(data, parts)
+            if delete:
+                if not had_key:
+                    return None
                 _del_at_path(data, parts)
             else:
-                new_raw: object
-                if self._field_type == "number":
-                    try:
-                        new_raw = int(str(row.new_value_display).strip() or "0")
-                    except Exception:
-                        new_raw = 0
-                elif self._field_type == "bool":
-                    new_raw = str(row.new_value_display).strip().lower() in {"1", "true", "yes", "on"}
-                else:
-                    new_raw = str(row.new_value_display)
-                    if self._key_path.startswith("description/"):
-                        new_raw = _desc_for_json(str(new_raw))
-
+                # The file already holds this exact value (e.g. a blank description
+                # is stored as " "); don't rewrite it.
+                if had_key and type(cur_raw) is type(new_raw) and cur_raw == new_raw:
+                    return None
                 _set_at_path(data, parts, new_raw)
-
             try:
-                _write_json_dict(row.json_path, data)
+                _write_json_dict(json_path, data)
             except Exception as e:
-                QMessageBox.warning(self, "JSON Bulk Updater", f"Failed updating {row.json_path}: {e}")
-                return
+                return e
+            try:
+                st = json_path.stat()
+            except OSError:
+                return None
+            written[json_path] = (st.st_mtime_ns, st.st_size, data)
+            return None
+
+        errors: list[Exception | None] = []
+        if jobs:
+            try:
+                with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(jobs))) as pool:
+                    errors = list(pool.map(_update, jobs))
+            finally:
+                for json_path in jobs:
+                    entry = written.get(json_path)
+                    if entry is None:
+                        self._json_cache.pop(json_path, None)
+                    else:
+                        self._json_cache[json_path] = entry
+
+        # Every job has run by now, so report all failures together and still
+        # refresh: the other files were updated.
+        failed = [f"Failed updating {json_path}: {err}" for json_path, err in zip(jobs, errors) if err is not None]
+        if failed:
+            if len(failed) > _MAX_REPORTED_FAILURES:
+                failed = failed[:_MAX_REPORTED_FAILURES] + [f"... and {len(failed) - _MAX_REPORTED_FAILURES} more"]
+            QMessageBox.warning(self, "JSON Bulk Updater", "\n".join(failed))
 
         # Refresh table state after applying.
         self._preview_clicked()
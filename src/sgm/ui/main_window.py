@@ -57,6 +57,7 @@ from sgm.image_ops import (
     get_image_size,
     pil_from_qimage,
     save_png_resized_from_file,
+    set_fast_png_encode,
 )
 from sgm.resources import resource_path, resources_dir
 from sgm.io_utils import (
@@ -1799,6 +1800,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self._config = config
         self._config_path = config_path
+        set_fast_png_encode(config.fast_png_encode)
 
         self._folder: Path | None = None
         self._games: dict[str, GameAssets] = {}
@@ -4243,7 +4245,12 @@ class MainWindow(QMainWindow):
                 if box_path.exists():
                     small_dest = assets.folder / f"{assets.basename}_small.png"
                     try:
-                        save_png_resized_from_file(box_path, small_dest, expected=self._config.box_small_resolution)
+                        save_png_resized_from_file(
+                            box_path,
+                            small_dest,
+                            expected=self._config.box_small_resolution,
+                            paletted=self._config.paletted_box_small,
+                        )
                     except Exception as e:
                         QMessageBox.warning(self, "Box Small", str(e))
         # Preserve unsaved metadata edits when updating image thumbnails.
@@ -4344,7 +4351,12 @@ class MainWindow(QMainWindow):
             return
         dest = assets.folder / f"{assets.basename}_small.png"
         try:
-            save_png_resized_from_file(box_path, dest, expected=self._config.box_small_resolution)
+            save_png_resized_from_file(
+                box_path,
+                dest,
+                expected=self._config.box_small_resolution,
+                paletted=self._config.paletted_box_small,
+            )
         except Exception as e:
             QMessageBox.warning(self, "Box Small", str(e))
             return